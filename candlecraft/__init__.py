@@ -7,19 +7,30 @@ multiple providers (Binance, Twelve Data) and computing technical indicators.
 
 from candlecraft.api import (
     fetch_ohlcv,
+    fetch_ohlcv_many,
     get_available_providers,
     is_provider_available,
     list_indicators,
     load_indicator,
 )
-from candlecraft.models import OHLCV, AssetClass, Provider, RateLimitException
+from candlecraft.models import (
+    OHLCV,
+    AssetClass,
+    IndicatorResult,
+    OHLCVBatch,
+    Provider,
+    RateLimitException,
+)
 
 __version__ = "0.2.0"
 __all__ = [
     "fetch_ohlcv",
+    "fetch_ohlcv_many",
     "list_indicators",
     "load_indicator",
     "OHLCV",
+    "OHLCVBatch",
+    "IndicatorResult",
     "AssetClass",
     "Provider",
     "RateLimitException",
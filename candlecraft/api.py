@@ -9,12 +9,13 @@ import importlib.util
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from importlib import resources
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from candlecraft.models import OHLCV, AssetClass, Provider
+from candlecraft.models import OHLCV, AssetClass, OHLCVBatch, Provider
 from candlecraft.providers import (
     BINANCE_AVAILABLE,
     TWELVEDATA_AVAILABLE,
@@ -29,6 +30,14 @@ logger = logging.getLogger(__name__)
 
 _INDICATOR_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
 
+# Concurrent requests per provider host when fetching several symbols at once
+_DEFAULT_MAX_WORKERS = 5
+
+# Indicators loaded from a custom directory, keyed by path and invalidated
+# when the file or directory modification time changes
+_indicator_cache: Dict[Path, Tuple[int, Callable[..., list]]] = {}
+_indicator_list_cache: Dict[Path, Tuple[int, List[str]]] = {}
+
 
 def is_provider_available(provider: Provider) -> bool:
     """
@@ -101,7 +110,8 @@ def fetch_ohlcv(
     end: Optional[datetime] = None,
     timezone: Optional[str] = None,
     rate_limit_strategy: str = "raise",
-) -> List[OHLCV]:
+    return_batch: bool = False,
+) -> Union[List[OHLCV], OHLCVBatch]:
     """
     Unified function to fetch OHLCV data from appropriate provider.
 
@@ -117,9 +127,11 @@ def fetch_ohlcv(
         rate_limit_strategy: How to handle rate limits. Options:
             - "raise" (default): Raise RateLimitException when rate limit is hit
             - "sleep": Automatically wait and retry when rate limit is hit
+        return_batch: Return a columnar OHLCVBatch of NumPy arrays instead of
+            a list of OHLCV objects (lower memory for large backfills)
 
     Returns:
-        List of OHLCV objects
+        List of OHLCV objects, or an OHLCVBatch if return_batch is True
 
     Raises:
         ValueError: For invalid arguments, unsupported timeframes, or provider not available
@@ -177,17 +189,71 @@ def fetch_ohlcv(
                 f"Binance provider only supports CRYPTO asset class, got {asset_class.value}"
             )
         client = authenticate_binance()
-        return fetch_ohlcv_binance(client, symbol, timeframe, limit, start, end)
+        return fetch_ohlcv_binance(
+            client, symbol, timeframe, limit, start, end, return_batch=return_batch
+        )
     elif provider == Provider.TWELVEDATA:
         # Twelve Data supports all asset classes (crypto, forex, equity)
         client = authenticate_twelvedata()
         return fetch_ohlcv_twelvedata(
-            client, symbol, timeframe, asset_class, limit, start, end, timezone, rate_limit_strategy
+            client,
+            symbol,
+            timeframe,
+            asset_class,
+            limit,
+            start,
+            end,
+            timezone,
+            rate_limit_strategy,
+            return_batch=return_batch,
         )
     else:
         raise ValueError(f"Unsupported provider: {provider}")
 
 
+def fetch_ohlcv_many(
+    symbols: Sequence[str],
+    timeframe: str,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
+    **kwargs: Any,
+) -> Dict[str, Union[List[OHLCV], OHLCVBatch]]:
+    """
+    Fetch OHLCV data for several symbols concurrently.
+
+    Requests are I/O-bound, so running them on a small thread pool makes the
+    total wall time roughly that of the slowest symbol instead of the sum.
+
+    Args:
+        symbols: Trading symbols to fetch (e.g., ['BTCUSDT', 'ETHUSDT'])
+        timeframe: Time interval (e.g., '1h', '1d', '1m')
+        max_workers: Maximum number of concurrent requests (default: 5).
+            Keep this small; higher concurrency mostly adds tail latency and
+            rate-limit pressure.
+        **kwargs: Forwarded to :func:`fetch_ohlcv` (limit, start, end, ...)
+
+    Returns:
+        Dictionary mapping each symbol to its list of OHLCV objects (or
+        OHLCVBatch with return_batch=True), in the same order as ``symbols``
+
+    Raises:
+        Same as :func:`fetch_ohlcv`; the first failing symbol's error is raised.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    unique_symbols = list(dict.fromkeys(symbols))
+    if not unique_symbols:
+        return {}
+
+    workers = min(max_workers, len(unique_symbols))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            symbol: executor.submit(fetch_ohlcv, symbol, timeframe, **kwargs)
+            for symbol in unique_symbols
+        }
+        return {symbol: future.result() for symbol, future in futures.items()}
+
+
 def list_indicators(indicators_dir: Optional[Path] = None) -> List[str]:
     """
     List available indicator modules.
@@ -208,15 +274,25 @@ def list_indicators(indicators_dir: Optional[Path] = None) -> List[str]:
             and not entry.stem.startswith("_")
         )
 
-    if not indicators_dir.exists():
+    try:
+        mtime = indicators_dir.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
 
-    indicators = []
-    for file in indicators_dir.glob("*.py"):
-        if file.name != "__init__.py" and not file.name.startswith("_"):
-            indicators.append(file.stem)
+    cached = _indicator_list_cache.get(indicators_dir)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
 
-    return sorted(indicators)
+    with os.scandir(indicators_dir) as entries:
+        indicators = sorted(
+            entry.name[:-3]
+            for entry in entries
+            if entry.name.endswith(".py")
+            and not entry.name.startswith("_")
+            and entry.is_file()
+        )
+    _indicator_list_cache[indicators_dir] = (mtime, indicators)
+    return list(indicators)
 
 
 def load_indicator(
@@ -226,6 +302,9 @@ def load_indicator(
     """
     Load an indicator module dynamically.
 
+    Modules from ``indicators_dir`` are cached and only re-executed when the
+    file's modification time changes.
+
     Args:
         indicator_name: Name of the indicator (e.g., 'macd')
         indicators_dir: Optional override path (defaults to packaged indicators)
@@ -246,11 +325,18 @@ def load_indicator(
 
     if indicators_dir is not None:
         indicator_file = indicators_dir / f"{indicator_name}.py"
-        if not indicator_file.exists():
+        try:
+            mtime = indicator_file.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Indicator module not found: {indicator_file}. "
                 f"Expected file: {indicators_dir}/{indicator_name}.py"
-            )
+            ) from None
+
+        cached = _indicator_cache.get(indicator_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         try:
             spec = importlib.util.spec_from_file_location(
                 f"candlecraft.indicators.{indicator_name}",
@@ -280,4 +366,7 @@ def load_indicator(
             f"Indicator module '{indicator_name}' does not export a 'calculate' function"
         )
 
+    if indicators_dir is not None:
+        _indicator_cache[indicator_file] = (mtime, module.calculate)
+
     return module.calculate
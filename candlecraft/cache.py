@@ -0,0 +1,68 @@
+"""
+Opt-in on-disk cache for pages of closed candles.
+
+Closed candles never change, so a page that has been fetched once can be
+served from disk on later runs. Caching is enabled by pointing the
+``CANDLECRAFT_CACHE_DIR`` environment variable at a writable directory.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "CANDLECRAFT_CACHE_DIR"
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Return the configured cache directory, or None if caching is disabled."""
+    value = os.getenv(CACHE_DIR_ENV)
+    return Path(value).expanduser() if value else None
+
+
+def _page_path(cache_dir: Path, provider: str, key: Tuple[Any, ...]) -> Path:
+    """File holding one page; symbols may contain '/', so the key is hashed."""
+    digest = hashlib.blake2b("|".join(map(str, key)).encode(), digest_size=8).hexdigest()
+    return cache_dir / provider / f"{digest}.npy"
+
+
+def load_page(cache_dir: Path, provider: str, *key: Any) -> Optional[np.ndarray]:
+    """
+    Load a cached page of candle rows.
+
+    Args:
+        cache_dir: Cache directory from :func:`get_cache_dir`
+        provider: Provider name, used as a subdirectory
+        *key: Values identifying the page, e.g. (symbol, timeframe, window_start_ms)
+
+    Returns:
+        The stored array, or None on a miss or an unreadable file
+    """
+    path = _page_path(cache_dir, provider, key)
+    try:
+        return np.load(path, allow_pickle=False)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return None
+
+
+def save_page(cache_dir: Path, provider: str, *key: Any, rows: np.ndarray) -> None:
+    """Store a page of closed candle rows; concurrent writers never expose partial files."""
+    path = _page_path(cache_dir, provider, key)
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as f:
+            np.save(f, rows, allow_pickle=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write cache file %s: %s", path, e)
+        tmp_path.unlink(missing_ok=True)
@@ -2,5 +2,10 @@
 Technical indicator modules for candlecraft.
 
 Each module exports a ``calculate(ohlcv_data, **kwargs)`` function.
-Use :func:`candlecraft.load_indicator` to load indicators by name.
+Use :func:`candlecraft.load_indicator` to load indicators by name, or
+:class:`IndicatorPipeline` to run several indicators on the same series.
 """
+
+from candlecraft.indicators._pipeline import IndicatorPipeline
+
+__all__ = ["IndicatorPipeline"]
@@ -0,0 +1,69 @@
+"""
+Shared array helpers for indicator modules.
+"""
+
+from typing import Dict, Sequence, Union
+
+import numpy as np
+
+from candlecraft.models import OHLCVBatch
+
+# Single-letter keys returned by to_soa, mapped to OHLCV attribute names
+_SOA_FIELDS = {"o": "open", "h": "high", "l": "low", "c": "close", "v": "volume"}
+
+
+def to_soa(
+    ohlcv_data: Union[Sequence, OHLCVBatch],
+    fields: str = "hlcv",
+    dtype: np.dtype = np.float64,
+) -> Dict[str, np.ndarray]:
+    """
+    Extract OHLCV attributes into contiguous float arrays.
+
+    An OHLCVBatch is already columnar, so its arrays are used directly
+    without iterating candles.
+
+    Args:
+        ohlcv_data: List of OHLCV objects ordered by timestamp, or an OHLCVBatch
+        fields: Which arrays to build, as a string of keys from 'ohlcv'
+        dtype: Array dtype (default float64; float32 halves memory traffic at
+            the cost of roughly 7 significant digits)
+
+    Returns:
+        Dictionary mapping each requested key to an array. Missing volume is NaN.
+    """
+    if isinstance(ohlcv_data, OHLCVBatch):
+        return {
+            key: np.asarray(getattr(ohlcv_data, _SOA_FIELDS[key]), dtype=dtype)
+            for key in fields
+        }
+
+    n = len(ohlcv_data)
+    arrays = {}
+    for key in fields:
+        attr = _SOA_FIELDS[key]
+        if key == "v":
+            values = (
+                float("nan") if candle.volume is None else candle.volume
+                for candle in ohlcv_data
+            )
+        else:
+            values = (getattr(candle, attr) for candle in ohlcv_data)
+        arrays[key] = np.fromiter(values, dtype=dtype, count=n)
+    return arrays
+
+
+def true_range(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    """
+    Vectorized True Range.
+
+    TR = max(high - low, |high - prev_close|, |low - prev_close|), with
+    TR = high - low for the first bar.
+    """
+    tr = highs - lows
+    prev_close = closes[:-1]
+    tr[1:] = np.maximum(
+        tr[1:],
+        np.maximum(np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close)),
+    )
+    return tr
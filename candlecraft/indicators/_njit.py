@@ -0,0 +1,33 @@
+"""
+Optional Numba support for indicator kernels.
+
+Kernels decorated with :func:`njit` are compiled to native code when Numba is
+installed (``pip install candlecraft[fast]``). Without Numba the decorator is a
+no-op and the same kernels run as plain Python, producing identical results.
+"""
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """
+    Compile a kernel with ``numba.njit`` when available.
+
+    Supports both bare ``@njit`` and ``@njit(cache=True, ...)`` usage.
+    """
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable) -> Callable:
+        return func
+
+    return decorator
@@ -0,0 +1,111 @@
+"""
+Run several indicators over one OHLCV series with shared intermediates.
+"""
+
+import importlib
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa, true_range
+from candlecraft.models import OHLCV, IndicatorResult
+
+# Pipeline attributes passed positionally to each indicator module's _compute
+_INDICATOR_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "adx": ("highs", "lows", "true_ranges"),
+    "atr": ("true_ranges",),
+    "bollinger": ("closes",),
+    "ema": ("closes",),
+    "heikin_ashi": ("opens", "highs", "lows", "closes"),
+    "macd": ("closes",),
+    "obv": ("closes", "volumes"),
+    "rsi": ("closes",),
+    "sma": ("closes",),
+    "stochastic": ("highs", "lows", "closes"),
+    "vwap": ("highs", "lows", "closes", "volumes"),
+}
+
+
+class IndicatorPipeline:
+    """
+    Compute packaged indicators on one OHLCV series, sharing intermediates.
+
+    Price columns are extracted from the candles once, on first use, and
+    derived series such as True Range are computed once for every indicator
+    that needs them (ATR and ADX). Results are memoised per indicator and
+    parameter set.
+
+    Pass ``dtype=np.float32`` to run the vectorized steps on single-precision
+    inputs, which halves memory traffic on long series. Prefix sums still
+    accumulate in float64 and outputs stay float64, but inputs only carry
+    about 7 significant digits, so results can differ from :func:`calculate`
+    in the last rounded digit.
+
+    Example:
+        pipeline = IndicatorPipeline(candles)
+        atr = pipeline.compute("atr", period=14)
+        adx = pipeline.compute("adx", period=14)
+    """
+
+    def __init__(self, ohlcv_data: List[OHLCV], dtype: np.dtype = np.float64) -> None:
+        self.ohlcv_data = ohlcv_data
+        self.dtype = dtype
+        self._results: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], IndicatorResult] = {}
+
+    @cached_property
+    def opens(self) -> np.ndarray:
+        return to_soa(self.ohlcv_data, "o", self.dtype)["o"]
+
+    @cached_property
+    def highs(self) -> np.ndarray:
+        return to_soa(self.ohlcv_data, "h", self.dtype)["h"]
+
+    @cached_property
+    def lows(self) -> np.ndarray:
+        return to_soa(self.ohlcv_data, "l", self.dtype)["l"]
+
+    @cached_property
+    def closes(self) -> np.ndarray:
+        return to_soa(self.ohlcv_data, "c", self.dtype)["c"]
+
+    @cached_property
+    def volumes(self) -> np.ndarray:
+        return to_soa(self.ohlcv_data, "v", self.dtype)["v"]
+
+    @cached_property
+    def true_ranges(self) -> np.ndarray:
+        return true_range(self.highs, self.lows, self.closes)
+
+    def compute(self, indicator_name: str, **params: Any) -> IndicatorResult:
+        """
+        Compute a packaged indicator, reusing shared inputs.
+
+        Args:
+            indicator_name: Name of the indicator (e.g., 'atr')
+            **params: Indicator parameters, as accepted by its calculate function
+
+        Returns:
+            IndicatorResult with the same values as the module's compute()
+
+        Raises:
+            ValueError: If the indicator is not supported by the pipeline
+        """
+        inputs = _INDICATOR_INPUTS.get(indicator_name)
+        if inputs is None:
+            raise ValueError(
+                f"Unsupported indicator for pipeline: {indicator_name!r}. "
+                f"Available: {', '.join(sorted(_INDICATOR_INPUTS))}"
+            )
+
+        key = (indicator_name, tuple(sorted(params.items())))
+        result = self._results.get(key)
+        if result is None:
+            module = importlib.import_module(f"candlecraft.indicators.{indicator_name}")
+            result = module._compute(*(getattr(self, name) for name in inputs), **params)
+            self._results[key] = result
+        return result
+
+    def calculate(self, indicator_name: str, **params: Any) -> List[Dict[str, Any]]:
+        """Like :meth:`compute`, returning the per-bar dictionaries of ``calculate``."""
+        return self.compute(indicator_name, **params).to_dicts()
@@ -8,23 +8,52 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing ATR indicator values aligned by timestamp.
 """
 
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa, true_range
+from candlecraft.indicators._njit import njit
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+@njit(cache=True)
+def _atr_loop(true_ranges, period):
+    """EMA of true range seeded with the SMA of the first period; NaN before that."""
+    n = true_ranges.shape[0]
+    atr = np.full(n, np.nan)
+    total = 0.0
+    for i in range(period):
+        total += true_ranges[i]
+    atr[period - 1] = total / period
+
+    multiplier = 2.0 / (period + 1)
+    for i in range(period, n):
+        atr[i] = (true_ranges[i] - atr[i - 1]) * multiplier + atr[i - 1]
+    return atr
+
+
+def _compute(true_ranges: np.ndarray, period: int = 14) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(true_ranges)
+    if n < period + 1:
+        # Not enough data for ATR calculation
+        return IndicatorResult({"atr": np.full(n, np.nan)})
+
+    atr = _atr_loop(true_ranges, period)
+    return IndicatorResult({"atr": np.round(atr, 8)})
+
+
+def compute(ohlcv_data: List[OHLCV], period: int = 14) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    arr = to_soa(ohlcv_data, "hlc")
+    true_ranges = true_range(arr["h"], arr["l"], arr["c"])
+    return _compute(true_ranges, period)
 
 
 def calculate(ohlcv_data: List[OHLCV], period: int = 14) -> List[Dict[str, Any]]:
@@ -43,40 +72,34 @@ def calculate(ohlcv_data: List[OHLCV], period: int = 14) -> List[Dict[str, Any]]
         List of dictionaries with key: 'atr'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < period + 1:
-        # Not enough data for ATR calculation
-        return [{"atr": None} for _ in ohlcv_data]
-
-    # Calculate True Range for each period
-    true_ranges = []
-
-    for i in range(len(ohlcv_data)):
-        if i == 0:
-            # First period: TR = high - low
-            tr = ohlcv_data[i].high - ohlcv_data[i].low
+    return compute(ohlcv_data, period=period).to_dicts()
+
+
+class AtrState:
+    """Incremental ATR: EMA of true range seeded with the SMA of the first period."""
+
+    __slots__ = ("period", "multiplier", "count", "value", "prev_close")
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        self.multiplier = 2.0 / (period + 1)
+        self.count = 0
+        self.value = 0.0
+        self.prev_close: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """Add a bar and return the ATR, or None until period bars are seen."""
+        tr = high - low
+        if self.prev_close is not None:
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+
+        self.count += 1
+        if self.count < self.period:
+            self.value += tr
+            return None
+        if self.count == self.period:
+            self.value = (self.value + tr) / self.period
         else:
-            # TR = max(high-low, |high-prev_close|, |low-prev_close|)
-            high_low = ohlcv_data[i].high - ohlcv_data[i].low
-            high_prev_close = abs(ohlcv_data[i].high - ohlcv_data[i - 1].close)
-            low_prev_close = abs(ohlcv_data[i].low - ohlcv_data[i - 1].close)
-            tr = max(high_low, high_prev_close, low_prev_close)
-
-        true_ranges.append(tr)
-
-    # Calculate ATR using EMA
-    result = []
-    multiplier = 2.0 / (period + 1)
-
-    # Start with SMA for the first ATR value
-    sma = sum(true_ranges[:period]) / period
-    result.extend([{"atr": None} for _ in range(period - 1)])
-    result.append({"atr": round(sma, 8)})
-
-    # Calculate EMA for remaining values
-    atr_prev = sma
-    for i in range(period, len(true_ranges)):
-        atr_value = (true_ranges[i] - atr_prev) * multiplier + atr_prev
-        result.append({"atr": round(atr_value, 8)})
-        atr_prev = atr_value
-
-    return result
+            self.value = (tr - self.value) * self.multiplier + self.value
+        return round(self.value, 8)
@@ -8,24 +8,50 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing Bollinger Bands indicator values aligned by timestamp.
 """
 
-import statistics
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+def _compute(closes: np.ndarray, period: int = 20, std_mult: float = 2.0) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(closes)
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    if n >= period:
+        # Strided view of every window (no copy); NumPy's reductions compute the
+        # mean and two-pass sample std per window in C
+        windows = sliding_window_view(closes, period)
+        sma = windows.mean(axis=1)
+        std = windows.std(axis=1, ddof=1)
+
+        upper[period - 1:] = sma + std_mult * std
+        middle[period - 1:] = sma
+        lower[period - 1:] = sma - std_mult * std
+
+    return IndicatorResult({
+        "bb_upper": np.round(upper, 8),
+        "bb_middle": np.round(middle, 8),
+        "bb_lower": np.round(lower, 8),
+    })
+
+
+def compute(ohlcv_data: List[OHLCV], period: int = 20, std_mult: float = 2.0) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    closes = to_soa(ohlcv_data, "c")["c"]
+    return _compute(closes, period, std_mult)
 
 
 def calculate(ohlcv_data: List[OHLCV], period: int = 20, std_mult: float = 2.0) -> List[Dict[str, Any]]:
@@ -46,35 +72,40 @@ def calculate(ohlcv_data: List[OHLCV], period: int = 20, std_mult: float = 2.0)
         List of dictionaries with keys: 'bb_upper', 'bb_middle', 'bb_lower'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < period:
-        # Not enough data for Bollinger Bands calculation
-        return [{"bb_upper": None, "bb_middle": None, "bb_lower": None} for _ in ohlcv_data]
-
-    closes = [candle.close for candle in ohlcv_data]
-    result = []
-
-    # Calculate Bollinger Bands for each period
-    for i in range(len(closes)):
-        if i < period - 1:
-            result.append({"bb_upper": None, "bb_middle": None, "bb_lower": None})
-        else:
-            # Get the window of closes for this period
-            window = closes[i - period + 1:i + 1]
-
-            # Calculate SMA (middle band)
-            sma = sum(window) / period
-
-            # Calculate standard deviation
-            std = statistics.stdev(window)
-
-            # Calculate upper and lower bands
-            upper = sma + (std_mult * std)
-            lower = sma - (std_mult * std)
-
-            result.append({
-                "bb_upper": round(upper, 8),
-                "bb_middle": round(sma, 8),
-                "bb_lower": round(lower, 8),
-            })
-
-    return result
+    return compute(ohlcv_data, period=period, std_mult=std_mult).to_dicts()
+
+
+class BollingerState:
+    """
+    Incremental Bollinger Bands for streaming or backtest loops.
+
+    The window mean is kept as a running sum (O(1) per update); the sample
+    standard deviation is a two-pass sum over the window, which stays exact
+    for high-priced symbols where a running sum of squares loses precision.
+    """
+
+    __slots__ = ("period", "std_mult", "window", "sum")
+
+    def __init__(self, period: int = 20, std_mult: float = 2.0) -> None:
+        self.period = period
+        self.std_mult = std_mult
+        self.window: Deque[float] = deque()
+        self.sum = 0.0
+
+    def update(self, close: float) -> Optional[Dict[str, float]]:
+        """Add a close and return the bands, or None until period closes are seen."""
+        window = self.window
+        window.append(close)
+        self.sum += close
+        if len(window) > self.period:
+            self.sum -= window.popleft()
+        if len(window) < self.period:
+            return None
+
+        mean = self.sum / self.period
+        std = math.sqrt(sum((value - mean) ** 2 for value in window) / (self.period - 1))
+        return {
+            "bb_upper": round(mean + self.std_mult * std, 8),
+            "bb_middle": round(mean, 8),
+            "bb_lower": round(mean - self.std_mult * std, 8),
+        }
@@ -8,23 +8,54 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing EMA indicator values aligned by timestamp.
 """
 
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.indicators._njit import njit
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+@njit(cache=True)
+def _ema_loop(closes, period):
+    """EMA seeded with the SMA of the first period closes; NaN before that."""
+    n = closes.shape[0]
+    ema = np.full(n, np.nan)
+    multiplier = 2.0 / (period + 1)
+
+    ema_prev = 0.0
+    for i in range(period):
+        ema_prev += closes[i]
+    ema_prev /= period
+    ema[period - 1] = ema_prev
+
+    for i in range(period, n):
+        ema_prev = (closes[i] - ema_prev) * multiplier + ema_prev
+        ema[i] = ema_prev
+    return ema
+
+
+def _compute(closes: np.ndarray, period: int = 20) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(closes)
+    if n < period:
+        # Not enough data for EMA calculation
+        return IndicatorResult({"ema": np.full(n, np.nan)})
+
+    ema = _ema_loop(closes, period)
+    return IndicatorResult({"ema": np.round(ema, 8)})
+
+
+def compute(ohlcv_data: List[OHLCV], period: int = 20) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    closes = to_soa(ohlcv_data, "c")["c"]
+    return _compute(closes, period)
 
 
 def calculate(ohlcv_data: List[OHLCV], period: int = 20) -> List[Dict[str, Any]]:
@@ -43,25 +74,28 @@ def calculate(ohlcv_data: List[OHLCV], period: int = 20) -> List[Dict[str, Any]]
         List of dictionaries with key: 'ema'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < period:
-        # Not enough data for EMA calculation
-        return [{"ema": None} for _ in ohlcv_data]
+    return compute(ohlcv_data, period=period).to_dicts()
 
-    closes = [candle.close for candle in ohlcv_data]
-    result = []
 
-    multiplier = 2.0 / (period + 1)
+class EmaState:
+    """Incremental EMA, seeded with the SMA of the first period closes."""
 
-    # Start with SMA for the first EMA value
-    sma = sum(closes[:period]) / period
-    result.extend([{"ema": None} for _ in range(period - 1)])
-    result.append({"ema": round(sma, 8)})
+    __slots__ = ("period", "multiplier", "count", "value")
 
-    # Calculate EMA for remaining values
-    ema_prev = sma
-    for i in range(period, len(closes)):
-        ema_value = (closes[i] - ema_prev) * multiplier + ema_prev
-        result.append({"ema": round(ema_value, 8)})
-        ema_prev = ema_value
+    def __init__(self, period: int = 20) -> None:
+        self.period = period
+        self.multiplier = 2.0 / (period + 1)
+        self.count = 0
+        self.value = 0.0
 
-    return result
+    def update(self, close: float) -> Optional[float]:
+        """Add a close and return the EMA, or None until period closes are seen."""
+        self.count += 1
+        if self.count < self.period:
+            self.value += close
+            return None
+        if self.count == self.period:
+            self.value = (self.value + close) / self.period
+        else:
+            self.value = (close - self.value) * self.multiplier + self.value
+        return round(self.value, 8)
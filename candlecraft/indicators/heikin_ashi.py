@@ -0,0 +1,89 @@
+"""
+Heikin-Ashi Candles Indicator
+
+This module provides a Heikin-Ashi indicator function that can be dynamically loaded
+by the pull_ohlcv.py script.
+
+The calculate function accepts a list of OHLCV objects and returns a list of
+dictionaries containing Heikin-Ashi candle values aligned by timestamp.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.indicators._njit import njit
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+@njit(cache=True, fastmath=True)
+def _heikin_ashi(opens, highs, lows, closes):
+    """Compute Heikin-Ashi open/high/low/close arrays (recursive on HA open)."""
+    n = opens.shape[0]
+    ha_c = np.empty(n)
+    ha_o = np.empty(n)
+    ha_h = np.empty(n)
+    ha_l = np.empty(n)
+
+    for i in range(n):
+        ha_c[i] = (opens[i] + highs[i] + lows[i] + closes[i]) * 0.25
+
+    if n == 0:
+        return ha_o, ha_h, ha_l, ha_c
+
+    ha_o[0] = (opens[0] + closes[0]) * 0.5
+    for i in range(1, n):
+        ha_o[i] = (ha_o[i - 1] + ha_c[i - 1]) * 0.5
+
+    for i in range(n):
+        ha_h[i] = max(highs[i], ha_o[i], ha_c[i])
+        ha_l[i] = min(lows[i], ha_o[i], ha_c[i])
+
+    return ha_o, ha_h, ha_l, ha_c
+
+
+def _compute(
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    ha_o, ha_h, ha_l, ha_c = _heikin_ashi(opens, highs, lows, closes)
+    return IndicatorResult({
+        "ha_open": np.round(ha_o, 8),
+        "ha_high": np.round(ha_h, 8),
+        "ha_low": np.round(ha_l, 8),
+        "ha_close": np.round(ha_c, 8),
+    })
+
+
+def compute(ohlcv_data: List[OHLCV]) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    arr = to_soa(ohlcv_data, "ohlc")
+    return _compute(arr["o"], arr["h"], arr["l"], arr["c"])
+
+
+def calculate(ohlcv_data: List[OHLCV]) -> List[Dict[str, Any]]:
+    """
+    Calculate Heikin-Ashi candle values for OHLCV data.
+
+    Formula:
+    - HA_Close = (open + high + low + close) / 4
+    - HA_Open = (prev HA_Open + prev HA_Close) / 2, seeded with (open + close) / 2
+    - HA_High = max(high, HA_Open, HA_Close)
+    - HA_Low = min(low, HA_Open, HA_Close)
+
+    Args:
+        ohlcv_data: List of OHLCV objects ordered by timestamp
+
+    Returns:
+        List of dictionaries with keys: 'ha_open', 'ha_high', 'ha_low', 'ha_close'
+    """
+    return compute(ohlcv_data).to_dicts()
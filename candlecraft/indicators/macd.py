@@ -8,23 +8,106 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing MACD indicator values aligned by timestamp.
 """
 
-import sys
 from typing import Any, Dict, List
 
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.indicators._njit import njit
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+@njit(cache=True)
+def _macd_loop(closes, fast_period, slow_period, signal_period):
+    """
+    Compute MACD line, signal line and histogram in a single forward pass.
+
+    Each EMA is seeded with the SMA of its first period values. The signal EMA
+    runs over the valid MACD values and is aligned to bars exactly as the
+    previous list-based implementation did. Undefined values are NaN.
+    """
+    n = closes.shape[0]
+    macd = np.full(n, np.nan)
+    signal = np.full(n, np.nan)
+    histogram = np.full(n, np.nan)
+    signal_ema = np.full(n, np.nan)
+
+    fast_mult = 2.0 / (fast_period + 1)
+    slow_mult = 2.0 / (slow_period + 1)
+    signal_mult = 2.0 / (signal_period + 1)
+    first_macd = max(fast_period, slow_period) - 1
+    signal_offset = signal_period - 1
+
+    fast = 0.0
+    slow = 0.0
+    sig = 0.0
+    for i in range(n):
+        close = closes[i]
+        if i < fast_period:
+            fast += close
+            if i == fast_period - 1:
+                fast /= fast_period
+        else:
+            fast = (close - fast) * fast_mult + fast
+
+        if i < slow_period:
+            slow += close
+            if i == slow_period - 1:
+                slow /= slow_period
+        else:
+            slow = (close - slow) * slow_mult + slow
+
+        if i < first_macd:
+            continue
+        macd[i] = fast - slow
+
+        k = i - first_macd
+        if k < signal_period:
+            sig += macd[i]
+            if k == signal_offset:
+                sig /= signal_period
+                signal_ema[i] = sig
+        else:
+            sig = (macd[i] - sig) * signal_mult + sig
+            signal_ema[i] = sig
+
+        if k >= 2 * signal_offset:
+            signal[i] = signal_ema[i - signal_offset]
+            histogram[i] = macd[i] - signal[i]
+
+    return macd, signal, histogram
+
+
+def _compute(
+    closes: np.ndarray,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(closes)
+    if n < slow_period + signal_period:
+        # Not enough data for MACD calculation
+        empty = np.full(n, np.nan)
+        return IndicatorResult({"macd": empty, "signal": empty.copy(), "histogram": empty.copy()})
+
+    macd, signal, histogram = _macd_loop(closes, fast_period, slow_period, signal_period)
+    return IndicatorResult({
+        "macd": np.round(macd, 8),
+        "signal": np.round(signal, 8),
+        "histogram": np.round(histogram, 8),
+    })
+
+
+def compute(ohlcv_data: List[OHLCV], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    closes = to_soa(ohlcv_data, "c")["c"]
+    return _compute(closes, fast_period, slow_period, signal_period)
 
 
 def calculate(ohlcv_data: List[OHLCV], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> List[Dict[str, Any]]:
@@ -41,84 +124,9 @@ def calculate(ohlcv_data: List[OHLCV], fast_period: int = 12, slow_period: int =
         List of dictionaries with keys: 'macd', 'signal', 'histogram'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < slow_period + signal_period:
-        # Not enough data for MACD calculation
-        return [{"macd": None, "signal": None, "histogram": None} for _ in ohlcv_data]
-
-    closes = [candle.close for candle in ohlcv_data]
-
-    # Calculate EMAs
-    def ema(values: List[float], period: int) -> List[float]:
-        """Calculate Exponential Moving Average."""
-        if len(values) < period:
-            return [None] * len(values)
-
-        result = []
-        multiplier = 2.0 / (period + 1)
-
-        # Start with SMA
-        sma = sum(values[:period]) / period
-        result.append(sma)
-
-        # Calculate EMA for remaining values
-        for i in range(period, len(values)):
-            ema_value = (values[i] - result[-1]) * multiplier + result[-1]
-            result.append(ema_value)
-
-        return [None] * (period - 1) + result
-
-    fast_ema = ema(closes, fast_period)
-    slow_ema = ema(closes, slow_period)
-
-    # Calculate MACD line (fast EMA - slow EMA)
-    macd_line = []
-    for i in range(len(closes)):
-        if fast_ema[i] is not None and slow_ema[i] is not None:
-            macd_line.append(fast_ema[i] - slow_ema[i])
-        else:
-            macd_line.append(None)
-
-    # Calculate signal line (EMA of MACD line)
-    # Extract valid MACD values (skip None values)
-    valid_macd = [v for v in macd_line if v is not None]
-
-    if len(valid_macd) < signal_period:
-        signal_line = [None] * len(macd_line)
-    else:
-        # Calculate EMA on valid MACD values
-        signal_ema_values = ema(valid_macd, signal_period)
-
-        # Map signal values back to original positions
-        signal_line = []
-        valid_idx = 0
-        for macd_val in macd_line:
-            if macd_val is not None:
-                # This position has a valid MACD value
-                # Find corresponding signal value (accounting for signal_period offset)
-                signal_idx = valid_idx - (signal_period - 1)
-                if signal_idx >= 0 and signal_idx < len(signal_ema_values):
-                    signal_line.append(signal_ema_values[signal_idx])
-                else:
-                    signal_line.append(None)
-                valid_idx += 1
-            else:
-                signal_line.append(None)
-
-    # Calculate histogram (MACD - Signal)
-    result = []
-    for i in range(len(ohlcv_data)):
-        macd_val = macd_line[i]
-        signal_val = signal_line[i] if i < len(signal_line) else None
-
-        if macd_val is not None and signal_val is not None:
-            histogram = macd_val - signal_val
-        else:
-            histogram = None
-
-        result.append({
-            "macd": round(macd_val, 8) if macd_val is not None else None,
-            "signal": round(signal_val, 8) if signal_val is not None else None,
-            "histogram": round(histogram, 8) if histogram is not None else None,
-        })
-
-    return result
+    return compute(
+        ohlcv_data,
+        fast_period=fast_period,
+        slow_period=slow_period,
+        signal_period=signal_period,
+    ).to_dicts()
@@ -8,23 +8,35 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing OBV indicator values aligned by timestamp.
 """
 
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+def _compute(closes: np.ndarray, volumes: np.ndarray) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    missing = np.isnan(volumes)
+
+    # Bars without volume leave OBV unchanged; the first bar seeds it with its volume
+    deltas = np.where(missing, 0.0, volumes)
+    deltas[1:] *= np.sign(np.diff(closes))
+    obv = np.round(np.cumsum(deltas, dtype=np.float64), 2)
+    obv[missing] = np.nan
+    return IndicatorResult({"obv": obv})
+
+
+def compute(ohlcv_data: List[OHLCV]) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    arr = to_soa(ohlcv_data, "cv")
+    return _compute(arr["c"], arr["v"])
 
 
 def calculate(ohlcv_data: List[OHLCV]) -> List[Dict[str, Any]]:
@@ -43,29 +55,29 @@ def calculate(ohlcv_data: List[OHLCV]) -> List[Dict[str, Any]]:
         List of dictionaries with key: 'obv'
         Values are None if volume data is missing.
     """
-    result = []
-    obv = 0.0
-
-    for i, candle in enumerate(ohlcv_data):
-        if candle.volume is None:
-            result.append({"obv": None})
-            continue
-
-        if i == 0:
-            # First period: OBV starts at volume (or 0)
-            obv = candle.volume
-        else:
-            prev_close = ohlcv_data[i - 1].close
-            current_close = candle.close
-
-            if current_close > prev_close:
-                # Price increased: add volume
-                obv += candle.volume
-            elif current_close < prev_close:
-                # Price decreased: subtract volume
-                obv -= candle.volume
-            # If price unchanged, OBV remains the same
-
-        result.append({"obv": round(obv, 2)})
-
-    return result
+    return compute(ohlcv_data).to_dicts()
+
+
+class ObvState:
+    """Incremental OBV; bars without volume return None and leave OBV unchanged."""
+
+    __slots__ = ("value", "prev_close")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.prev_close: Optional[float] = None
+
+    def update(self, close: float, volume: Optional[float]) -> Optional[float]:
+        """Add a bar and return the OBV, or None if the bar has no volume."""
+        prev_close = self.prev_close
+        self.prev_close = close
+        if volume is None:
+            return None
+
+        if prev_close is None:
+            self.value = volume
+        elif close > prev_close:
+            self.value += volume
+        elif close < prev_close:
+            self.value -= volume
+        return round(self.value, 2)
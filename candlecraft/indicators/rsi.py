@@ -8,23 +8,68 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing RSI indicator values aligned by timestamp.
 """
 
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.indicators._njit import njit
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+@njit(cache=True)
+def _rsi_loop(closes, period):
+    """RSI with Wilder's smoothing of average gain/loss; NaN for the first period bars."""
+    n = closes.shape[0]
+    rsi = np.full(n, np.nan)
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            avg_gain += change
+        elif change < 0:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            change = closes[i] - closes[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            # Wilder's smoothing: new_avg = (prev_avg * (n-1) + current) / n
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss == 0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+    return rsi
+
+
+def _compute(closes: np.ndarray, period: int = 14) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(closes)
+    if n < period + 1:
+        # Not enough data for RSI calculation
+        return IndicatorResult({"rsi": np.full(n, np.nan)})
+
+    rsi = _rsi_loop(closes, period)
+    return IndicatorResult({"rsi": np.round(rsi, 2)})
+
+
+def compute(ohlcv_data: List[OHLCV], period: int = 14) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    closes = to_soa(ohlcv_data, "c")["c"]
+    return _compute(closes, period)
 
 
 def calculate(ohlcv_data: List[OHLCV], period: int = 14) -> List[Dict[str, Any]]:
@@ -43,50 +88,45 @@ def calculate(ohlcv_data: List[OHLCV], period: int = 14) -> List[Dict[str, Any]]
         List of dictionaries with key: 'rsi'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < period + 1:
-        # Not enough data for RSI calculation
-        return [{"rsi": None} for _ in ohlcv_data]
-
-    closes = [candle.close for candle in ohlcv_data]
-    result = [{"rsi": None} for _ in range(period)]
-
-    # Calculate price changes
-    price_changes = []
-    for i in range(1, len(closes)):
-        change = closes[i] - closes[i - 1]
-        price_changes.append(change)
-
-    # Initial average gain and loss (first period)
-    gains = [max(0, change) for change in price_changes[:period]]
-    losses = [max(0, -change) for change in price_changes[:period]]
-
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-
-    # Calculate first RSI value
-    if avg_loss == 0:
-        rsi = 100.0
-    else:
-        rs = avg_gain / avg_loss
-        rsi = 100.0 - (100.0 / (1.0 + rs))
-
-    result.append({"rsi": round(rsi, 2)})
-
-    # Calculate subsequent RSI values using Wilder's smoothing
-    for i in range(period, len(price_changes)):
-        current_gain = max(0, price_changes[i])
-        current_loss = max(0, -price_changes[i])
-
-        # Wilder's smoothing: new_avg = (prev_avg * (n-1) + current) / n
-        avg_gain = (avg_gain * (period - 1) + current_gain) / period
-        avg_loss = (avg_loss * (period - 1) + current_loss) / period
-
-        if avg_loss == 0:
-            rsi = 100.0
+    return compute(ohlcv_data, period=period).to_dicts()
+
+
+class RsiState:
+    """Incremental RSI with Wilder's smoothing."""
+
+    __slots__ = ("period", "count", "avg_gain", "avg_loss", "prev_close")
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.prev_close: Optional[float] = None
+
+    def update(self, close: float) -> Optional[float]:
+        """Add a close and return the RSI, or None until period changes are seen."""
+        prev_close = self.prev_close
+        self.prev_close = close
+        if prev_close is None:
+            return None
+
+        change = close - prev_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        period = self.period
+
+        self.count += 1
+        if self.count < period:
+            self.avg_gain += gain
+            self.avg_loss += loss
+            return None
+        if self.count == period:
+            self.avg_gain = (self.avg_gain + gain) / period
+            self.avg_loss = (self.avg_loss + loss) / period
         else:
-            rs = avg_gain / avg_loss
-            rsi = 100.0 - (100.0 / (1.0 + rs))
-
-        result.append({"rsi": round(rsi, 2)})
+            self.avg_gain = (self.avg_gain * (period - 1) + gain) / period
+            self.avg_loss = (self.avg_loss * (period - 1) + loss) / period
 
-    return result
+        if self.avg_loss == 0:
+            return 100.0
+        return round(100.0 - (100.0 / (1.0 + self.avg_gain / self.avg_loss)), 2)
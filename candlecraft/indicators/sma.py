@@ -8,23 +8,39 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing SMA indicator values aligned by timestamp.
 """
 
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+def _compute(closes: np.ndarray, period: int = 20) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(closes)
+    sma = np.full(n, np.nan)
+    if n >= period:
+        # Window sums from a prefix sum: O(N) instead of re-summing each window;
+        # accumulated in float64 even for float32 inputs to avoid drift
+        csum = np.cumsum(closes, dtype=np.float64)
+        window_sums = csum[period - 1:].copy()
+        window_sums[1:] -= csum[:-period]
+        sma[period - 1:] = window_sums / period
+
+    return IndicatorResult({"sma": np.round(sma, 8)})
+
+
+def compute(ohlcv_data: List[OHLCV], period: int = 20) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    closes = to_soa(ohlcv_data, "c")["c"]
+    return _compute(closes, period)
 
 
 def calculate(ohlcv_data: List[OHLCV], period: int = 20) -> List[Dict[str, Any]]:
@@ -41,19 +57,30 @@ def calculate(ohlcv_data: List[OHLCV], period: int = 20) -> List[Dict[str, Any]]
         List of dictionaries with key: 'sma'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < period:
-        # Not enough data for SMA calculation
-        return [{"sma": None} for _ in ohlcv_data]
-
-    closes = [candle.close for candle in ohlcv_data]
-    result = []
-
-    # Calculate SMA for each period
-    for i in range(len(closes)):
-        if i < period - 1:
-            result.append({"sma": None})
-        else:
-            sma = sum(closes[i - period + 1:i + 1]) / period
-            result.append({"sma": round(sma, 8)})
-
-    return result
+    return compute(ohlcv_data, period=period).to_dicts()
+
+
+class SmaState:
+    """
+    Incremental SMA for streaming or backtest loops.
+
+    Each update is O(1), so feeding one new close per bar avoids recomputing
+    the whole series with :func:`calculate`.
+    """
+
+    __slots__ = ("period", "window", "sum")
+
+    def __init__(self, period: int = 20) -> None:
+        self.period = period
+        self.window: Deque[float] = deque()
+        self.sum = 0.0
+
+    def update(self, close: float) -> Optional[float]:
+        """Add a close and return the SMA, or None until period closes are seen."""
+        self.window.append(close)
+        self.sum += close
+        if len(self.window) > self.period:
+            self.sum -= self.window.popleft()
+        if len(self.window) < self.period:
+            return None
+        return round(self.sum / self.period, 8)
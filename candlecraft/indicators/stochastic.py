@@ -8,23 +8,118 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing Stochastic Oscillator indicator values aligned by timestamp.
 """
 
-import sys
+from collections import deque
 from typing import Any, Dict, List
 
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.indicators._njit import njit
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+@njit(cache=True)
+def _rolling_max(values, window):
+    """
+    Rolling maximum over ``window`` bars using a monotonic deque of indices.
+
+    Each index is pushed and popped at most once, so the pass is O(N). NaN for
+    the first window - 1 bars.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    idx_buf = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and values[idx_buf[tail - 1]] <= values[i]:
+            tail -= 1
+        idx_buf[tail] = i
+        tail += 1
+        if idx_buf[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = values[idx_buf[head]]
+    return out
+
+
+@njit(cache=True)
+def _rolling_min(values, window):
+    """Rolling minimum counterpart of :func:`_rolling_max`."""
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    idx_buf = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and values[idx_buf[tail - 1]] >= values[i]:
+            tail -= 1
+        idx_buf[tail] = i
+        tail += 1
+        if idx_buf[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = values[idx_buf[head]]
+    return out
+
+
+def _compute(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    k_period: int = 14,
+    d_period: int = 3,
+) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    n = len(closes)
+    if n < k_period + d_period - 1:
+        # Not enough data for Stochastic calculation
+        empty = np.full(n, np.nan)
+        return IndicatorResult({"stoch_k": empty, "stoch_d": empty.copy()})
+
+    highest_high = _rolling_max(highs, k_period)
+    lowest_low = _rolling_min(lows, k_period)
+
+    # %K, with 50 on flat windows to avoid division by zero
+    price_range = highest_high - lowest_low
+    flat = price_range == 0
+    stoch_k_array = np.divide(
+        closes - lowest_low,
+        price_range,
+        out=np.full(n, np.nan),
+        where=~flat,
+    ) * 100.0
+    stoch_k_array[flat] = 50.0
+
+    # %D is the mean of the last d_period %K values, kept as a running sum
+    stoch_d_array = np.full(n, np.nan)
+    recent_k: deque = deque()
+    running_sum = 0.0
+
+    first_k = k_period - 1
+    for i, stoch_k in enumerate(stoch_k_array[first_k:].tolist(), start=first_k):
+        recent_k.append(stoch_k)
+        running_sum += stoch_k
+        if len(recent_k) > d_period:
+            running_sum -= recent_k.popleft()
+        if len(recent_k) == d_period:
+            stoch_d_array[i] = running_sum / d_period
+
+    return IndicatorResult({
+        "stoch_k": np.round(stoch_k_array, 2),
+        "stoch_d": np.round(stoch_d_array, 2),
+    })
+
+
+def compute(ohlcv_data: List[OHLCV], k_period: int = 14, d_period: int = 3) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    arr = to_soa(ohlcv_data, "hlc")
+    return _compute(arr["h"], arr["l"], arr["c"], k_period, d_period)
 
 
 def calculate(ohlcv_data: List[OHLCV], k_period: int = 14, d_period: int = 3) -> List[Dict[str, Any]]:
@@ -44,41 +139,4 @@ def calculate(ohlcv_data: List[OHLCV], k_period: int = 14, d_period: int = 3) ->
         List of dictionaries with keys: 'stoch_k', 'stoch_d'
         Values are None for periods before enough data is available.
     """
-    if len(ohlcv_data) < k_period + d_period - 1:
-        # Not enough data for Stochastic calculation
-        return [{"stoch_k": None, "stoch_d": None} for _ in ohlcv_data]
-
-    result = []
-    stoch_k_values = []
-
-    # Calculate %K for each period
-    for i in range(len(ohlcv_data)):
-        if i < k_period - 1:
-            result.append({"stoch_k": None, "stoch_d": None})
-            stoch_k_values.append(None)
-        else:
-            # Get the window for this period
-            window = ohlcv_data[i - k_period + 1:i + 1]
-
-            # Find highest high and lowest low in the window
-            highest_high = max(candle.high for candle in window)
-            lowest_low = min(candle.low for candle in window)
-
-            # Calculate %K
-            if highest_high == lowest_low:
-                stoch_k = 50.0  # Avoid division by zero
-            else:
-                stoch_k = ((ohlcv_data[i].close - lowest_low) / (highest_high - lowest_low)) * 100.0
-
-            stoch_k_values.append(stoch_k)
-
-            # Calculate %D (SMA of %K) if we have enough values
-            if len([v for v in stoch_k_values if v is not None]) < d_period:
-                result.append({"stoch_k": round(stoch_k, 2), "stoch_d": None})
-            else:
-                # Get the last d_period valid %K values
-                valid_k_values = [v for v in stoch_k_values if v is not None][-d_period:]
-                stoch_d = sum(valid_k_values) / d_period
-                result.append({"stoch_k": round(stoch_k, 2), "stoch_d": round(stoch_d, 2)})
-
-    return result
+    return compute(ohlcv_data, k_period=k_period, d_period=d_period).to_dicts()
@@ -8,23 +8,49 @@ The calculate function accepts a list of OHLCV objects and returns a list of
 dictionaries containing VWAP indicator values aligned by timestamp.
 """
 
-import sys
-from typing import Any, Dict, List
-
-# Import OHLCV from candlecraft library
-try:
-    from candlecraft import OHLCV
-except ImportError:
-    # Fallback: try importing from parent directory (for backward compatibility)
-    import os
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    try:
-        from candlecraft import OHLCV
-    except ImportError:
-        # Last resort: try pull_ohlcv (for legacy support)
-        from pull_ohlcv import OHLCV
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from candlecraft.indicators._common import to_soa
+from candlecraft.models import OHLCV, IndicatorResult
+
+
+def _compute(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+) -> IndicatorResult:
+    """Array-level :func:`compute`, shared with IndicatorPipeline."""
+    # Bars with missing or zero volume are skipped but keep their position
+    valid = (volumes != 0) & ~np.isnan(volumes)
+
+    typical_prices = (highs + lows + closes) / 3.0
+    # Accumulate in float64 even for float32 inputs to avoid drift
+    cumulative_price_volume = np.cumsum(
+        np.where(valid, typical_prices * volumes, 0.0), dtype=np.float64
+    )
+    cumulative_volume = np.cumsum(np.where(valid, volumes, 0.0), dtype=np.float64)
+
+    vwap = np.divide(
+        cumulative_price_volume,
+        cumulative_volume,
+        out=np.full(len(closes), np.nan),
+        where=valid,
+    )
+    return IndicatorResult({"vwap": np.round(vwap, 8)})
+
+
+def compute(ohlcv_data: List[OHLCV]) -> IndicatorResult:
+    """
+    Columnar form of :func:`calculate`.
+
+    Returns an IndicatorResult of float64 arrays with NaN where
+    :func:`calculate` reports None.
+    """
+    arr = to_soa(ohlcv_data, "hlcv")
+    return _compute(arr["h"], arr["l"], arr["c"], arr["v"])
 
 
 def calculate(ohlcv_data: List[OHLCV]) -> List[Dict[str, Any]]:
@@ -42,24 +68,24 @@ def calculate(ohlcv_data: List[OHLCV]) -> List[Dict[str, Any]]:
         List of dictionaries with key: 'vwap'
         Values are None if volume data is missing.
     """
-    result = []
-    cumulative_price_volume = 0.0
-    cumulative_volume = 0.0
+    return compute(ohlcv_data).to_dicts()
 
-    for candle in ohlcv_data:
-        if candle.volume is None or candle.volume == 0:
-            result.append({"vwap": None})
-            continue
 
-        # Calculate typical price
-        typical_price = (candle.high + candle.low + candle.close) / 3.0
+class VwapState:
+    """Incremental cumulative VWAP; bars with missing or zero volume are skipped."""
 
-        # Update cumulative values
-        cumulative_price_volume += typical_price * candle.volume
-        cumulative_volume += candle.volume
+    __slots__ = ("price_volume", "volume")
 
-        # Calculate VWAP
-        vwap = cumulative_price_volume / cumulative_volume
-        result.append({"vwap": round(vwap, 8)})
+    def __init__(self) -> None:
+        self.price_volume = 0.0
+        self.volume = 0.0
 
-    return result
+    def update(
+        self, high: float, low: float, close: float, volume: Optional[float]
+    ) -> Optional[float]:
+        """Add a bar and return the VWAP, or None if the bar has no volume."""
+        if volume is None or volume == 0:
+            return None
+        self.price_volume += (high + low + close) / 3.0 * volume
+        self.volume += volume
+        return round(self.price_volume / self.volume, 8)
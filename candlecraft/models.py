@@ -3,9 +3,12 @@ Data models for candlecraft library.
 """
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
 
 
 class AssetClass(Enum):
@@ -40,7 +43,7 @@ class RateLimitException(Exception):
         super().__init__(error_msg)
 
 
-@dataclass
+@dataclass(slots=True)
 class OHLCV:
     """Internal data model for OHLCV data."""
     timestamp: datetime
@@ -53,3 +56,119 @@ class OHLCV:
     timeframe: str
     asset_class: AssetClass
     source: str
+
+
+@dataclass
+class OHLCVBatch:
+    """
+    Columnar (struct-of-arrays) container for a run of OHLCV candles.
+
+    Timestamps are stored as a UTC ``datetime64[ms]`` array and prices as
+    contiguous ``float64`` arrays. Missing volume is represented as NaN.
+    Indexing or iterating yields OHLCV objects, built only when requested.
+    """
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    symbol: str
+    timeframe: str
+    asset_class: AssetClass
+    source: str
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, index: int) -> OHLCV:
+        volume = float(self.volume[index])
+        return OHLCV(
+            timestamp=self.timestamp[index].astype("datetime64[ms]").item().replace(
+                tzinfo=timezone.utc
+            ),
+            open=float(self.open[index]),
+            high=float(self.high[index]),
+            low=float(self.low[index]),
+            close=float(self.close[index]),
+            volume=None if volume != volume else volume,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            asset_class=self.asset_class,
+            source=self.source,
+        )
+
+    def __iter__(self) -> Iterator[OHLCV]:
+        return iter(self.to_ohlcv())
+
+    def to_ohlcv(self) -> List[OHLCV]:
+        """Materialize the batch as a list of OHLCV objects."""
+        timestamps = pd.DatetimeIndex(self.timestamp).tz_localize(timezone.utc).to_pydatetime()
+        volumes = [None if v != v else v for v in self.volume.tolist()]
+        return [
+            OHLCV(
+                timestamp=ts,
+                open=o,
+                high=h,
+                low=low,
+                close=c,
+                volume=v,
+                symbol=self.symbol,
+                timeframe=self.timeframe,
+                asset_class=self.asset_class,
+                source=self.source,
+            )
+            for ts, o, h, low, c, v in zip(
+                timestamps,
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                volumes,
+            )
+        ]
+
+
+@dataclass
+class IndicatorResult:
+    """
+    Columnar indicator output.
+
+    Holds one ``float64`` array per output field, aligned with the input
+    candles, with NaN where a value is undefined. Indexing or iterating yields
+    the same per-bar dictionaries as an indicator's ``calculate`` function
+    (NaN becomes None), built only when requested.
+    """
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, index: int) -> Dict[str, Optional[float]]:
+        row = {}
+        for name, values in self.columns.items():
+            value = float(values[index])
+            row[name] = None if value != value else value
+        return row
+
+    def __iter__(self) -> Iterator[Dict[str, Optional[float]]]:
+        names = list(self.columns)
+        for row in zip(*(values.tolist() for values in self.columns.values())):
+            yield {name: None if v != v else v for name, v in zip(names, row)}
+
+    def to_dicts(self) -> List[Dict[str, Optional[float]]]:
+        """Materialize all bars as a list of dictionaries."""
+        names = list(self.columns)
+        columns = []
+        for values in self.columns.values():
+            # NaN usually only covers the warm-up bars, so patch those few
+            # slots instead of testing every value
+            column = values.tolist()
+            for index in np.flatnonzero(np.isnan(values)).tolist():
+                column[index] = None
+            columns.append(column)
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def to_records(self) -> np.recarray:
+        """Return the columns as a single NumPy record array."""
+        return np.rec.fromarrays(list(self.columns.values()), names=list(self.columns))
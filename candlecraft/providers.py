@@ -5,12 +5,24 @@ Provider implementations for fetching OHLCV data.
 import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
-from candlecraft.models import OHLCV, AssetClass, RateLimitException
-from candlecraft.utils import get_default_timezone, normalize_symbol, to_utc, validate_ohlcv
+import numpy as np
+import pandas as pd
+
+from candlecraft.cache import get_cache_dir, load_page, save_page
+from candlecraft.models import OHLCV, AssetClass, OHLCVBatch, RateLimitException
+from candlecraft.utils import (
+    get_default_timezone,
+    normalize_symbol,
+    to_utc,
+    validate_ohlcv_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,9 +53,306 @@ except ImportError:
 RATE_LIMIT_RAISE = "raise"
 RATE_LIMIT_SLEEP = "sleep"
 
+# Binance kline pagination
+BINANCE_MAX_KLINES = 1000
+BINANCE_MAX_WORKERS = 5
+BINANCE_WEIGHT_PER_MINUTE = 1200
+BINANCE_KLINES_WEIGHT = 2
+
+# Supported Binance timeframes with an upper bound of one candle's length,
+# used to split date ranges into windows of at most BINANCE_MAX_KLINES candles
+_BINANCE_INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 60 * 60_000,
+    "4h": 4 * 60 * 60_000,
+    "1d": 24 * 60 * 60_000,
+    "1w": 7 * 24 * 60 * 60_000,
+    "1M": 31 * 24 * 60 * 60_000,
+}
+
+_DAY_MS = 24 * 60 * 60_000
+
+# Twelve Data interval names per timeframe
+_TWELVEDATA_INTERVALS = {
+    "1m": "1min",
+    "5m": "5min",
+    "15m": "15min",
+    "30m": "30min",
+    "1h": "1h",
+    "4h": "4h",
+    "1d": "1day",
+    "1w": "1week",
+    "1M": "1month",
+}
+
+
+class _TokenBucket:
+    """Thread-safe token bucket used to pace requests under a provider budget."""
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.refill_per_second
+            time.sleep(wait)
+
+
+_binance_weight_bucket = _TokenBucket(
+    BINANCE_WEIGHT_PER_MINUTE, BINANCE_WEIGHT_PER_MINUTE / 60.0
+)
+
+# Twelve Data credits are granted per minute and depend on the plan. Every
+# response reports the credits left in the current minute in this header; the
+# client's session records it, and requests only wait once it reaches zero.
+_TWELVEDATA_CREDITS_LEFT_HEADER = "api-credits-left"
+
+# Optional proactive pacing on top of the headers: set this to the plan's
+# requests per minute (e.g. 8 on the free tier) to spread calls evenly
+TWELVEDATA_RATE_ENV = "CANDLECRAFT_TD_RATE"
+
+_twelvedata_credits_lock = threading.Lock()
+_twelvedata_credits = {"left": float("inf"), "reset_at": 0.0}
+
+
+def _record_twelvedata_credits(response: Any, *args: Any, **kwargs: Any) -> None:
+    """requests response hook: remember the credits left until the next minute."""
+    value = response.headers.get(_TWELVEDATA_CREDITS_LEFT_HEADER)
+    if value is None:
+        return
+    try:
+        left = int(value)
+    except ValueError:
+        return
+    now = time.time()
+    with _twelvedata_credits_lock:
+        _twelvedata_credits["left"] = left
+        _twelvedata_credits["reset_at"] = now - now % 60 + 60
+
+
+@lru_cache(maxsize=4)
+def _parse_twelvedata_rate(value: str) -> float:
+    try:
+        rate = float(value)
+    except ValueError:
+        rate = float("nan")
+    if not 0 < rate < float("inf"):
+        raise ValueError(
+            f"{TWELVEDATA_RATE_ENV} must be a positive number of requests per minute, "
+            f"got {value!r}"
+        )
+    return rate
+
+
+def _twelvedata_rate() -> Optional[float]:
+    """Return the CANDLECRAFT_TD_RATE pacing rate, or None when it is unset."""
+    value = os.getenv(TWELVEDATA_RATE_ENV)
+    return _parse_twelvedata_rate(value) if value else None
+
+
+@lru_cache(maxsize=4)
+def _twelvedata_bucket(requests_per_minute: float) -> _TokenBucket:
+    return _TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+
+
+def _pace_twelvedata(rate: Optional[float] = None) -> None:
+    """
+    Wait before a Twelve Data request when the credit budget requires it.
+
+    Sleeps until the next minute once the last response reported no credits
+    left, and additionally takes a token from the ``rate`` requests-per-minute
+    bucket when CANDLECRAFT_TD_RATE is set.
+    """
+    if rate is not None:
+        _twelvedata_bucket(rate).acquire()
+
+    with _twelvedata_credits_lock:
+        wait = _twelvedata_credits["reset_at"] - time.time()
+        exhausted = _twelvedata_credits["left"] <= 0
+        if exhausted and wait <= 0:
+            _twelvedata_credits["left"] = float("inf")
+    if exhausted and wait > 0:
+        logger.info("Twelve Data credits exhausted; waiting %.1f seconds", wait)
+        time.sleep(wait)
+
+
+def _binance_windows(start_ms: int, end_ms: int, interval_ms: int) -> List[Tuple[int, int]]:
+    """Split [start_ms, end_ms] into inclusive windows of at most BINANCE_MAX_KLINES candles."""
+    span = BINANCE_MAX_KLINES * interval_ms
+    return [
+        (window_start, min(window_start + span - 1, end_ms))
+        for window_start in range(start_ms, end_ms + 1, span)
+    ]
+
+
+def _binance_klines_array(klines: List[list]) -> np.ndarray:
+    """Parse raw Binance kline rows into an (n, 6) float64 array of open time and OHLCV."""
+    if not klines:
+        return np.empty((0, 6), dtype=np.float64)
+    return np.asarray(klines, dtype=object)[:, :6].astype(np.float64)
+
+
+def _rows_to_batch(
+    rows: np.ndarray,
+    symbol: str,
+    timeframe: str,
+    asset_class: AssetClass,
+    source: str,
+) -> OHLCVBatch:
+    """Convert an (n, 6) array of open time (ms) and OHLCV into a columnar OHLCVBatch."""
+    return OHLCVBatch(
+        timestamp=rows[:, 0].astype(np.int64).view("datetime64[ms]"),
+        open=rows[:, 1],
+        high=rows[:, 2],
+        low=rows[:, 3],
+        close=rows[:, 4],
+        volume=rows[:, 5],
+        symbol=symbol,
+        timeframe=timeframe,
+        asset_class=asset_class,
+        source=source,
+    )
+
+
+def _batch_to_rows(batch: OHLCVBatch) -> np.ndarray:
+    """Inverse of :func:`_rows_to_batch`, used to store a batch in the page cache."""
+    return np.column_stack(
+        (
+            batch.timestamp.astype(np.int64),
+            batch.open,
+            batch.high,
+            batch.low,
+            batch.close,
+            batch.volume,
+        )
+    ).astype(np.float64)
+
+
+def _twelvedata_frame_to_batch(
+    df: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    asset_class: AssetClass,
+) -> OHLCVBatch:
+    """Convert a Twelve Data time-series DataFrame into a columnar OHLCVBatch."""
+    prices = df[["open", "high", "low", "close"]].apply(pd.to_numeric, errors="coerce")
+    prices = prices.to_numpy(dtype=np.float64)
+    if "volume" in df.columns:
+        volume = pd.to_numeric(df["volume"], errors="coerce").to_numpy(dtype=np.float64)
+    else:
+        volume = np.full(len(df), np.nan)
+
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    timestamps = index.values.astype("datetime64[ms]")
+
+    valid = ~np.isnan(prices).any(axis=1)
+    if not valid.all():
+        logger.warning("Skipping %s malformed Twelve Data rows", int((~valid).sum()))
+        prices, volume, timestamps = prices[valid], volume[valid], timestamps[valid]
+
+    return OHLCVBatch(
+        timestamp=timestamps,
+        open=prices[:, 0],
+        high=prices[:, 1],
+        low=prices[:, 2],
+        close=prices[:, 3],
+        volume=volume,
+        symbol=symbol,
+        timeframe=timeframe,
+        asset_class=asset_class,
+        source="twelvedata",
+    )
+
+
+# Keep-alive connection pool shared by each cached provider client; sized to
+# cover BINANCE_MAX_WORKERS concurrent requests
+HTTP_POOL_SIZE = 10
+
+# Transient failures (connection errors, 429 and 5xx responses) are retried
+# with jittered exponential backoff; Retry-After is honoured when sent
+HTTP_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_BACKOFF_MAX = 30
+HTTP_BACKOFF_JITTER = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _http_retry() -> Any:
+    """Build the urllib3 retry policy for provider sessions."""
+    from urllib3.util.retry import Retry
+
+    options = dict(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        # Hand the last response back so provider error handling still sees it
+        raise_on_status=False,
+    )
+    try:
+        return Retry(**options, backoff_max=HTTP_BACKOFF_MAX, backoff_jitter=HTTP_BACKOFF_JITTER)
+    except TypeError:
+        # urllib3 < 2 has no backoff_max/backoff_jitter arguments
+        return Retry(**options)
+
+
+def _mount_pooled_adapter(session: Any) -> None:
+    """Mount a pooled, retrying HTTPS adapter on a requests session."""
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=_http_retry(),
+    )
+    session.mount("https://", adapter)
+
+
+@lru_cache(maxsize=8)
+def _binance_client(api_key: Optional[str], api_secret: Optional[str], testnet: bool) -> Client:
+    """Create one Binance client per credential set and reuse it across calls."""
+    client = Client(api_key=api_key, api_secret=api_secret, testnet=testnet)
+    _mount_pooled_adapter(client.session)
+    return client
+
+
+@lru_cache(maxsize=8)
+def _twelvedata_client(api_key: str) -> TDClient:
+    """Create one Twelve Data client per API key and reuse it across calls."""
+    client = TDClient(apikey=api_key)
+    session = getattr(getattr(client.ctx, "http_client", None), "session", None)
+    if session is not None:
+        _mount_pooled_adapter(session)
+        session.hooks["response"].append(_record_twelvedata_credits)
+    return client
+
 
 def authenticate_binance():
-    """Authenticate with Binance API."""
+    """
+    Authenticate with Binance API.
+
+    Clients are cached per credential set so repeated calls reuse the same
+    keep-alive connection pool. The cached client is shared between threads;
+    it only issues independent GET requests, which requests.Session handles
+    concurrently.
+    """
     if not BINANCE_AVAILABLE:
         raise ImportError(
             "python-binance library not installed. "
@@ -56,14 +365,14 @@ def authenticate_binance():
 
     if api_key and api_secret:
         try:
-            client = Client(api_key=api_key, api_secret=api_secret, testnet=testnet)
+            client = _binance_client(api_key, api_secret, testnet)
             logger.info("Authenticated with Binance API (testnet=%s)", testnet)
             return client
         except Exception as e:
             raise RuntimeError(f"Binance authentication failed: {e}") from e
 
     try:
-        client = Client(testnet=testnet)
+        client = _binance_client(None, None, testnet)
         logger.info("Using Binance public API (no authentication required)")
         logger.debug(
             "For higher rate limits, set BINANCE_API_KEY and BINANCE_API_SECRET"
@@ -74,7 +383,12 @@ def authenticate_binance():
 
 
 def authenticate_twelvedata():
-    """Authenticate with Twelve Data API."""
+    """
+    Authenticate with Twelve Data API.
+
+    Clients are cached per API key so repeated calls reuse the same
+    keep-alive connection pool.
+    """
     if not TWELVEDATA_AVAILABLE:
         raise ImportError(
             "twelvedata library not installed. "
@@ -90,7 +404,7 @@ def authenticate_twelvedata():
         )
 
     try:
-        client = TDClient(apikey=api_key)
+        client = _twelvedata_client(api_key)
         logger.info("Authenticated with Twelve Data API")
         return client
     except Exception as e:
@@ -104,34 +418,25 @@ def fetch_ohlcv_binance(
     limit: Optional[int] = None,
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
-) -> List[OHLCV]:
-    """Fetch OHLCV data from Binance."""
-    interval_map = {
-        "1m": Client.KLINE_INTERVAL_1MINUTE,
-        "5m": Client.KLINE_INTERVAL_5MINUTE,
-        "15m": Client.KLINE_INTERVAL_15MINUTE,
-        "30m": Client.KLINE_INTERVAL_30MINUTE,
-        "1h": Client.KLINE_INTERVAL_1HOUR,
-        "4h": Client.KLINE_INTERVAL_4HOUR,
-        "1d": Client.KLINE_INTERVAL_1DAY,
-        "1w": Client.KLINE_INTERVAL_1WEEK,
-        "1M": Client.KLINE_INTERVAL_1MONTH,
-    }
-
-    if timeframe not in interval_map:
+    return_batch: bool = False,
+) -> Union[List[OHLCV], OHLCVBatch]:
+    """
+    Fetch OHLCV data from Binance.
+
+    Returns a list of OHLCV objects, or a columnar OHLCVBatch if return_batch is True.
+    """
+    if timeframe not in _BINANCE_INTERVAL_MS:
         raise ValueError(
             f"Unsupported timeframe: {timeframe}. "
-            f"Supported: {', '.join(interval_map.keys())}"
+            f"Supported: {', '.join(_BINANCE_INTERVAL_MS.keys())}"
         )
 
-    interval = interval_map[timeframe]
+    # Binance interval names are the same strings as candlecraft timeframes
+    interval = timeframe
     symbol_upper = symbol.upper()
 
-    try:
-        client.ping()
-    except Exception as e:
-        raise ConnectionError(f"Binance connection test failed: {e}") from e
-
+    # No separate ping round trip: connectivity errors surface from the
+    # klines request itself (requests' exceptions are OSError subclasses)
     try:
         if limit:
             if limit > 1000:
@@ -147,11 +452,14 @@ def fetch_ohlcv_binance(
                 symbol_upper,
                 timeframe,
             )
-            klines = client.get_klines(
-                symbol=symbol_upper,
-                interval=interval,
-                limit=limit,
+            rows = _binance_klines_array(
+                client.get_klines(
+                    symbol=symbol_upper,
+                    interval=interval,
+                    limit=limit,
+                )
             )
+            validate_ohlcv_batch(rows[:, 1], rows[:, 2], rows[:, 3], rows[:, 4])
         elif start and end:
             start_ms = int(start.timestamp() * 1000)
             end_ms = int(end.timestamp() * 1000)
@@ -164,57 +472,82 @@ def fetch_ohlcv_binance(
                 end,
             )
 
-            all_klines = []
-            current_start = start_ms
-
-            while current_start < end_ms:
-                klines = client.get_klines(
-                    symbol=symbol_upper,
-                    interval=interval,
-                    startTime=current_start,
-                    endTime=end_ms,
-                    limit=1000,
+            interval_ms = _BINANCE_INTERVAL_MS[timeframe]
+            cache_dir = get_cache_dir()
+            if cache_dir is None:
+                windows = _binance_windows(start_ms, end_ms, interval_ms)
+            else:
+                # Cached pages are whole windows on a fixed grid, so overlapping
+                # ranges requested later map onto the same pages
+                span = BINANCE_MAX_KLINES * interval_ms
+                grid_end = end_ms - end_ms % span + span - 1
+                windows = _binance_windows(start_ms - start_ms % span, grid_end, interval_ms)
+                closed_before_ms = int(time.time() * 1000) - interval_ms
+            closed_pages: List[Tuple[int, np.ndarray]] = []
+
+            def fetch_window(window: Tuple[int, int]) -> np.ndarray:
+                if cache_dir is not None:
+                    page = load_page(cache_dir, "binance", symbol_upper, timeframe, window[0])
+                    if page is not None:
+                        return page
+
+                _binance_weight_bucket.acquire(BINANCE_KLINES_WEIGHT)
+                page = _binance_klines_array(
+                    client.get_klines(
+                        symbol=symbol_upper,
+                        interval=interval,
+                        startTime=window[0],
+                        endTime=window[1],
+                        limit=BINANCE_MAX_KLINES,
+                    )
                 )
-
-                if not klines:
-                    break
-
-                all_klines.extend(klines)
-
-                if len(klines) < 1000:
-                    break
-
-                current_start = klines[-1][0] + 1
-
-            klines = all_klines
+                if cache_dir is not None and window[1] < closed_before_ms:
+                    closed_pages.append((window[0], page))
+                return page
+
+            if len(windows) > 1:
+                workers = min(BINANCE_MAX_WORKERS, len(windows))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    pages = list(executor.map(fetch_window, windows))
+            else:
+                pages = [fetch_window(window) for window in windows]
+
+            # Pages are parsed as they arrive and copied into one buffer.
+            # Windows do not overlap, but keep open times strictly increasing
+            # in case the API returns a boundary candle twice, and drop the
+            # parts of grid-aligned cache windows outside the requested range
+            rows = np.concatenate(pages) if pages else np.empty((0, 6), dtype=np.float64)
+
+            # Validate every fetched row, including grid-window rows outside the
+            # range, before any page is cached, so bad rows never reach the cache
+            validate_ohlcv_batch(rows[:, 1], rows[:, 2], rows[:, 3], rows[:, 4])
+            for window_start, page in closed_pages:
+                save_page(cache_dir, "binance", symbol_upper, timeframe, window_start, rows=page)
+
+            open_times = rows[:, 0]
+            keep = (open_times >= start_ms) & (open_times <= end_ms)
+            keep[1:] &= open_times[1:] > np.maximum.accumulate(open_times)[:-1]
+            if not keep.all():
+                rows = rows[keep]
         else:
             raise ValueError("Either limit or both start and end must be provided")
 
-        if not klines:
+        if not len(rows):
             raise ValueError(f"No data returned for {symbol_upper}")
 
-        ohlcv_data = []
-        for kline in klines:
-            ohlcv = OHLCV(
-                timestamp=to_utc(datetime.fromtimestamp(kline[0] / 1000)),
-                open=float(kline[1]),
-                high=float(kline[2]),
-                low=float(kline[3]),
-                close=float(kline[4]),
-                volume=float(kline[5]),
-                symbol=symbol_upper,
-                timeframe=timeframe,
-                asset_class=AssetClass.CRYPTO,
-                source="binance",
-            )
-            validate_ohlcv(ohlcv)
-            ohlcv_data.append(ohlcv)
+        batch = _rows_to_batch(rows, symbol_upper, timeframe, AssetClass.CRYPTO, "binance")
+        if return_batch:
+            logger.info("Fetched %s candles from Binance for %s", len(batch), symbol_upper)
+            return batch
 
+        ohlcv_data = batch.to_ohlcv()
         logger.info("Fetched %s candles from Binance for %s", len(ohlcv_data), symbol_upper)
         return ohlcv_data
 
     except BinanceAPIException as e:
         raise RuntimeError(f"Binance API error: {e}") from e
+    except OSError as e:
+        raise ConnectionError(f"Binance connection failed: {e}") from e
     except Exception as e:
         raise RuntimeError(f"Error fetching data: {e}") from e
 
@@ -229,29 +562,23 @@ def fetch_ohlcv_twelvedata(
     end: Optional[datetime] = None,
     timezone: Optional[str] = None,
     rate_limit_strategy: str = RATE_LIMIT_RAISE,
-) -> List[OHLCV]:
-    """Fetch OHLCV data from Twelve Data."""
-    interval_map = {
-        "1m": "1min",
-        "5m": "5min",
-        "15m": "15min",
-        "30m": "30min",
-        "1h": "1h",
-        "4h": "4h",
-        "1d": "1day",
-        "1w": "1week",
-        "1M": "1month",
-    }
-
-    if timeframe not in interval_map:
+    return_batch: bool = False,
+) -> Union[List[OHLCV], OHLCVBatch]:
+    """
+    Fetch OHLCV data from Twelve Data.
+
+    Returns a list of OHLCV objects, or a columnar OHLCVBatch if return_batch is True.
+    """
+    if timeframe not in _TWELVEDATA_INTERVALS:
         raise ValueError(
             f"Unsupported timeframe: {timeframe}. "
-            f"Supported: {', '.join(interval_map.keys())}"
+            f"Supported: {', '.join(_TWELVEDATA_INTERVALS.keys())}"
         )
 
-    interval = interval_map[timeframe]
+    interval = _TWELVEDATA_INTERVALS[timeframe]
     symbol_normalized = normalize_symbol(symbol, asset_class)
     default_timezone = timezone if timezone else get_default_timezone(asset_class)
+    rate = _twelvedata_rate()
 
     def _is_rate_limit_error(error: Exception) -> bool:
         """Check if an exception is a rate limit error."""
@@ -331,6 +658,7 @@ def fetch_ohlcv_twelvedata(
                 retry_after=retry_after,
             )
 
+    save_key = None
     try:
         if limit:
             logger.info(
@@ -341,6 +669,7 @@ def fetch_ohlcv_twelvedata(
             )
 
             try:
+                _pace_twelvedata(rate)
                 ts = client.time_series(
                     symbol=symbol_normalized,
                     interval=interval,
@@ -350,6 +679,7 @@ def fetch_ohlcv_twelvedata(
                 df = ts.as_pandas()
             except Exception as e:
                 _handle_rate_limit_error(e)
+                _pace_twelvedata(rate)
                 ts = client.time_series(
                     symbol=symbol_normalized,
                     interval=interval,
@@ -358,6 +688,11 @@ def fetch_ohlcv_twelvedata(
                 )
                 df = ts.as_pandas()
 
+            if df.empty:
+                raise ValueError(f"No data returned for {symbol_normalized}")
+
+            batch = _twelvedata_frame_to_batch(df, symbol_normalized, timeframe, asset_class)
+
         elif start and end:
             logger.info(
                 "Fetching %s (%s) from %s to %s from Twelve Data",
@@ -370,56 +705,69 @@ def fetch_ohlcv_twelvedata(
             start_str = start.strftime("%Y-%m-%d")
             end_str = end.strftime("%Y-%m-%d")
 
-            try:
-                ts = client.time_series(
-                    symbol=symbol_normalized,
-                    interval=interval,
-                    start_date=start_str,
-                    end_date=end_str,
-                    timezone=default_timezone,
-                )
-                df = ts.as_pandas()
-            except Exception as e:
-                _handle_rate_limit_error(e)
-                ts = client.time_series(
-                    symbol=symbol_normalized,
-                    interval=interval,
-                    start_date=start_str,
-                    end_date=end_str,
-                    timezone=default_timezone,
+            # Only whole days are requested, so a range is cached once the end
+            # day, a day of slack for exchange timezones and one full candle
+            # (timeframes match the Binance table) lie in the past
+            cache_dir = get_cache_dir()
+            cache_key = (symbol_normalized, timeframe, start_str, end_str, default_timezone)
+            closed_ms = (
+                int(to_utc(end).timestamp() * 1000) + 2 * _DAY_MS + _BINANCE_INTERVAL_MS[timeframe]
+            )
+            rows = None
+            if cache_dir is not None:
+                rows = load_page(cache_dir, "twelvedata", *cache_key)
+
+            if rows is not None:
+                batch = _rows_to_batch(
+                    rows, symbol_normalized, timeframe, asset_class, "twelvedata"
                 )
-                df = ts.as_pandas()
+            else:
+                try:
+                    _pace_twelvedata(rate)
+                    ts = client.time_series(
+                        symbol=symbol_normalized,
+                        interval=interval,
+                        start_date=start_str,
+                        end_date=end_str,
+                        timezone=default_timezone,
+                    )
+                    df = ts.as_pandas()
+                except Exception as e:
+                    _handle_rate_limit_error(e)
+                    _pace_twelvedata(rate)
+                    ts = client.time_series(
+                        symbol=symbol_normalized,
+                        interval=interval,
+                        start_date=start_str,
+                        end_date=end_str,
+                        timezone=default_timezone,
+                    )
+                    df = ts.as_pandas()
+
+                if df.empty:
+                    raise ValueError(f"No data returned for {symbol_normalized}")
+
+                batch = _twelvedata_frame_to_batch(df, symbol_normalized, timeframe, asset_class)
+                if cache_dir is not None and closed_ms <= time.time() * 1000:
+                    save_key = cache_key
 
         else:
             raise ValueError("Either limit or both start and end must be provided")
 
-        if df.empty:
-            raise ValueError(f"No data returned for {symbol_normalized}")
+        validate_ohlcv_batch(batch.open, batch.high, batch.low, batch.close)
+        if save_key is not None:
+            # Saved only after validation, so the cache never holds bad rows
+            save_page(cache_dir, "twelvedata", *save_key, rows=_batch_to_rows(batch))
 
-        ohlcv_data = []
-        for timestamp, row in df.iterrows():
-            try:
-                ts = timestamp.to_pydatetime() if hasattr(timestamp, "to_pydatetime") else timestamp
-                ohlcv = OHLCV(
-                    timestamp=to_utc(ts),
-                    open=float(row["open"]),
-                    high=float(row["high"]),
-                    low=float(row["low"]),
-                    close=float(row["close"]),
-                    volume=float(row["volume"]) if "volume" in row else None,
-                    symbol=symbol_normalized,
-                    timeframe=timeframe,
-                    asset_class=asset_class,
-                    source="twelvedata",
-                )
-                validate_ohlcv(ohlcv)
-                ohlcv_data.append(ohlcv)
-            except ValueError:
-                raise
-            except Exception as e:
-                logger.warning("Failed to process Twelve Data row: %s", e)
-                continue
+        if return_batch:
+            logger.info(
+                "Fetched %s candles from Twelve Data for %s",
+                len(batch),
+                symbol_normalized,
+            )
+            return batch
 
+        ohlcv_data = batch.to_ohlcv()
         logger.info(
             "Fetched %s candles from Twelve Data for %s",
             len(ohlcv_data),
@@ -2,10 +2,23 @@
 Utility functions for candlecraft library.
 """
 
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
+
+import numpy as np
 
 from candlecraft.models import OHLCV, AssetClass
 
+# Common crypto base/quote assets used to recognise crypto symbols, matched
+# with one precompiled alternation instead of a substring scan per asset
+_CRYPTO_PATTERNS = ('USDT', 'BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOGE', 'XRP', 'DOT', 'LINK')
+_CRYPTO_RE = re.compile("|".join(_CRYPTO_PATTERNS))
+
+# Symbol helpers are called per fetch and per stream message with the same
+# few symbols, so their results are memoised
+_SYMBOL_CACHE_SIZE = 1024
+
 
 def to_utc(ts: datetime) -> datetime:
     """Convert datetime to timezone-aware UTC datetime."""
@@ -26,6 +39,28 @@ def validate_ohlcv(dp: OHLCV) -> None:
         raise ValueError("Invalid OHLCV: non-positive price")
 
 
+def validate_ohlcv_batch(
+    open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray
+) -> None:
+    """
+    Validate the invariants of validate_ohlcv on whole price columns at once.
+
+    Raises:
+        ValueError: Naming the first offending row, if any row is invalid
+    """
+    invalid = (
+        (high < low)
+        | (high < np.maximum(open_, close))
+        | (low > np.minimum(open_, close))
+        | (open_ <= 0)
+        | (close <= 0)
+    )
+    if invalid.any():
+        row = int(np.argmax(invalid))
+        raise ValueError(f"Invalid OHLCV at row {row}")
+
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def detect_asset_class(symbol: str) -> AssetClass:
     """
     Detect asset class from symbol format.
@@ -42,14 +77,14 @@ def detect_asset_class(symbol: str) -> AssetClass:
         return AssetClass.FOREX
 
     # Check for crypto patterns (ends with USDT, BTC, ETH, etc. or contains common crypto patterns)
-    crypto_patterns = ['USDT', 'BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOGE', 'XRP', 'DOT', 'LINK']
-    if any(pattern in symbol_upper for pattern in crypto_patterns) and '/' not in symbol_upper:
+    if _CRYPTO_RE.search(symbol_upper) and '/' not in symbol_upper:
         return AssetClass.CRYPTO
 
     # Default to equity (simple uppercase letters)
     return AssetClass.EQUITY
 
 
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def normalize_symbol(symbol: str, asset_class: AssetClass) -> str:
     """Normalize symbol format based on asset class."""
     if asset_class == AssetClass.FOREX:
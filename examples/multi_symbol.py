@@ -0,0 +1,11 @@
+"""Fetch several crypto symbols concurrently and print the latest close for each."""
+
+from candlecraft import fetch_ohlcv_many
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"]
+
+candles_by_symbol = fetch_ohlcv_many(SYMBOLS, "1h", limit=24)
+
+for symbol, candles in candles_by_symbol.items():
+    latest = candles[-1]
+    print(f"{symbol:<8} {latest.timestamp:%Y-%m-%d %H:%M}  close={latest.close:.4f}")
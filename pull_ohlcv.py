@@ -26,47 +26,149 @@ import os
 import sys
 import argparse
 import json
+import socket
 import time
-import signal
 import threading
-import importlib.util
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Callable, Tuple, Protocol
+from datetime import date, datetime, time as dt_time, timezone
+from typing import List, Optional, Dict, Any, Callable, Tuple, Protocol, Deque, NamedTuple
+from collections import deque
+from functools import lru_cache
 import csv
 from pathlib import Path
 
-# Load environment variables from .env file
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
-
 # Import from candlecraft library
 from candlecraft import fetch_ohlcv, OHLCV, AssetClass
-from candlecraft.utils import detect_asset_class, to_utc, normalize_symbol, validate_ohlcv
-from candlecraft.providers import authenticate_binance, authenticate_twelvedata
+from candlecraft.utils import detect_asset_class, normalize_symbol, validate_ohlcv
 from candlecraft.api import load_indicator
 
-# Import providers for streaming
 try:
-    from binance.client import Client
-    from binance.exceptions import BinanceAPIException
-    BINANCE_AVAILABLE = True
+    import websocket
+    WEBSOCKET_AVAILABLE = True
 except ImportError:
-    BINANCE_AVAILABLE = False
+    WEBSOCKET_AVAILABLE = False
 
+# Optional faster JSON codec (pip install candlecraft[fast])
 try:
-    from twelvedata import TDClient
-    TWELVEDATA_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    TWELVEDATA_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Optional columnar file output (pip install candlecraft[parquet])
 try:
-    import websocket
-    WEBSOCKET_AVAILABLE = True
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
 except ImportError:
-    WEBSOCKET_AVAILABLE = False
+    PYARROW_AVAILABLE = False
+
+# Binance sends compact JSON; in-progress kline ticks carry this marker
+_KLINE_OPEN_MARKER = '"x":false'
+
+# Binance kline stream intervals use the same names as candlecraft timeframes
+BINANCE_STREAM_TIMEFRAMES = frozenset({"1m", "5m", "15m", "30m", "1h", "4h", "1d", "1w", "1M"})
+
+# Binance accepts at most this many streams on one combined-stream connection
+BINANCE_MAX_COMBINED_STREAMS = 1024
+
+# Larger socket buffers mean fewer recv() calls under bursty stream traffic;
+# passed to run_forever so they are applied on every (re)connect
+STREAM_SOCKET_BUFFER_BYTES = 128 * 1024
+_STREAM_SOCKOPT = [
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, STREAM_SOCKET_BUFFER_BYTES),
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, STREAM_SOCKET_BUFFER_BYTES),
+]
+
+# Dropped streams reconnect until Ctrl+C with capped exponential backoff; the
+# attempt counter resets once a connection opens
+STREAM_RECONNECT_MAX_DELAY = 60
+
+# Closed klines come straight from Binance's matching engine, so per-candle
+# validation in the stream is opt-in; historical fetches always validate
+VALIDATE_STREAM_ENV = "CANDLECRAFT_VALIDATE_STREAM"
+
+# Backfill candles printed before a stream starts (CSV output keeps all of them)
+STREAM_BACKFILL_TAIL = 10
+
+
+# Polling schedule: seconds between polls, and candles re-fetched after the first poll
+POLL_INTERVAL_SECONDS = 60
+POLL_REFRESH_LIMIT = 2
+
+
+def merge_candles(window: Deque[OHLCV], fresh: List[OHLCV]) -> bool:
+    """
+    Merge freshly fetched candles into a rolling window of candles.
+
+    Candles newer than the window's last timestamp are appended in time order;
+    a candle with the same timestamp as the last one replaces it (it may still
+    be forming). Providers may return candles newest-first, so input order
+    does not matter.
+
+    Returns:
+        True if the window's last timestamp advanced, False otherwise
+    """
+    last_ts = window[-1].timestamp if window else None
+    for candle in sorted(fresh, key=lambda c: c.timestamp):
+        if not window or candle.timestamp > window[-1].timestamp:
+            window.append(candle)
+        elif candle.timestamp == window[-1].timestamp:
+            window[-1] = candle
+    return bool(window) and window[-1].timestamp != last_ts
+
+
+class CandleBatcher:
+    """
+    Accumulates streamed candles and hands them to flush_fn in batches.
+
+    A batch is flushed once it holds max_n candles or max_ms milliseconds after
+    its first candle arrived, whichever comes first, so downstream writes (e.g.
+    a database insert) are batched while latency stays bounded.
+    """
+    def __init__(
+        self,
+        flush_fn: Callable[[List[OHLCV]], None],
+        max_n: int = 50,
+        max_ms: float = 250,
+    ):
+        if max_n < 1:
+            raise ValueError("max_n must be at least 1")
+        self.flush_fn = flush_fn
+        self.max_n = max_n
+        self.max_ms = max_ms
+        self._pending: List[OHLCV] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Held while a batch is taken and delivered, so the timer thread and
+        # size-triggered flushes never run flush_fn concurrently or out of order
+        self._flush_lock = threading.Lock()
+
+    def add(self, candle: OHLCV) -> None:
+        with self._lock:
+            self._pending.append(candle)
+            full = len(self._pending) >= self.max_n
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if batch:
+                self.flush_fn(batch)
+
+    def close(self) -> None:
+        """Flush any pending candles."""
+        self.flush()
 
 
 class Sink(Protocol):
@@ -78,79 +180,181 @@ class Sink(Protocol):
         ...
 
 
+_STREAM_CANDLE_FORMAT = "[{}] {} {}: O={:.8f} H={:.8f} L={:.8f} C={:.8f} V={:.8f}".format
+
+
+def stream_reconnect_delay(attempt: int) -> int:
+    """Seconds to wait before reconnect ``attempt`` (1-based): 1, 2, 4, ... capped."""
+    return min(2 ** (attempt - 1), STREAM_RECONNECT_MAX_DELAY)
+
+
+@lru_cache(maxsize=256)
+def _format_stream_timestamp(ts: datetime) -> str:
+    """Format stream timestamps; a stream only sees a new timestamp once per candle."""
+    return ts.isoformat(" ", "seconds")[:19]
+
+
+def format_stream_candle(candle: OHLCV) -> str:
+    """Format a streamed candle as a single log line."""
+    return _STREAM_CANDLE_FORMAT(
+        _format_stream_timestamp(candle.timestamp),
+        candle.symbol,
+        candle.timeframe,
+        candle.open,
+        candle.high,
+        candle.low,
+        candle.close,
+        candle.volume,
+    )
+
+
+class BinanceKline(NamedTuple):
+    """Closed kline fields parsed from a Binance stream message."""
+    open_time: int  # milliseconds since epoch
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    symbol: str
+
+
+def parse_binance_kline(data: Any) -> Optional[BinanceKline]:
+    """
+    Extract a closed kline from a decoded Binance kline message.
+
+    Accepts both raw kline events and combined-stream envelopes
+    (``{"stream": ..., "data": {...}}``).
+
+    Returns:
+        BinanceKline, or None if the message is not a closed kline
+
+    Raises:
+        ValueError: If a closed kline is missing fields or has non-numeric values
+    """
+    if not isinstance(data, dict):
+        return None
+    data = data.get("data", data)
+    kline = data.get("k") if isinstance(data, dict) else None
+    if not isinstance(kline, dict) or not kline.get("x", False):
+        return None
+    try:
+        return BinanceKline(
+            int(kline["t"]),
+            float(kline["o"]),
+            float(kline["h"]),
+            float(kline["l"]),
+            float(kline["c"]),
+            float(kline["v"]),
+            str(kline["s"]),
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Malformed Binance kline: {e!r}") from e
+
+
 def stream_realtime_binance(
     symbol: str,
     timeframe: str,
     on_candle: Optional[Callable[[OHLCV], None]] = None,
     on_error: Optional[Callable[[Exception], None]] = None,
+    on_batch: Optional[Callable[[List[OHLCV]], None]] = None,
+    batch_size: int = 50,
+    batch_max_ms: float = 250,
 ) -> None:
-    """Stream real-time OHLCV kline data from Binance WebSocket."""
+    """
+    Stream real-time OHLCV kline data for one symbol from Binance WebSocket.
+
+    See :func:`stream_realtime_binance_multi` for the callback arguments.
+    """
+    stream_realtime_binance_multi(
+        [symbol],
+        timeframe,
+        on_candle=on_candle,
+        on_error=on_error,
+        on_batch=on_batch,
+        batch_size=batch_size,
+        batch_max_ms=batch_max_ms,
+    )
+
+
+def stream_realtime_binance_multi(
+    symbols: List[str],
+    timeframe: str,
+    on_candle: Optional[Callable[[OHLCV], None]] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+    on_batch: Optional[Callable[[List[OHLCV]], None]] = None,
+    batch_size: int = 50,
+    batch_max_ms: float = 250,
+) -> None:
+    """
+    Stream real-time OHLCV kline data for several symbols over one WebSocket.
+
+    Uses Binance's combined stream endpoint, so any number of symbols (up to
+    BINANCE_MAX_COMBINED_STREAMS) share a single connection and keep-alive.
+    Each candle's symbol is taken from the message itself.
+
+    If on_batch is given, closed candles are delivered in micro-batches of up
+    to batch_size candles, flushed at most batch_max_ms after the first one
+    arrives (see CandleBatcher), instead of one on_candle call per candle.
+    """
     if not WEBSOCKET_AVAILABLE:
         print("Error: websocket-client library not installed.")
         print("Install it with: pip install websocket-client")
         sys.exit(1)
     
-    timeframe_map = {
-        "1m": "1m", "5m": "5m", "15m": "15m", "30m": "30m",
-        "1h": "1h", "4h": "4h", "1d": "1d", "1w": "1w", "1M": "1M",
-    }
-    
-    if timeframe not in timeframe_map:
+    if timeframe not in BINANCE_STREAM_TIMEFRAMES:
         print(f"✗ Unsupported timeframe for streaming: {timeframe}")
         sys.exit(1)
     
-    symbol_lower = symbol.lower()
-    interval = timeframe_map[timeframe]
-    stream_name = f"{symbol_lower}@kline_{interval}"
-    ws_url = f"wss://stream.binance.com:9443/ws/{stream_name}"
+    symbols_upper = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+    if not symbols_upper or len(symbols_upper) > BINANCE_MAX_COMBINED_STREAMS:
+        print(f"✗ Stream between 1 and {BINANCE_MAX_COMBINED_STREAMS} symbols per connection")
+        sys.exit(1)
+    
+    streams = "/".join(f"{symbol.lower()}@kline_{timeframe}" for symbol in symbols_upper)
+    ws_url = f"wss://stream.binance.com:9443/stream?streams={streams}"
     
     print(f"Connecting to Binance WebSocket: {ws_url}")
-    print(f"Streaming real-time {timeframe} candles for {symbol.upper()}...")
+    print(f"Streaming real-time {timeframe} candles for {', '.join(symbols_upper)}...")
     print("Press Ctrl+C to stop streaming\n")
     
     last_pong_time = time.time()
     reconnect_attempts = 0
-    max_reconnect_attempts = 5
+    stopping = False
+    batcher = CandleBatcher(on_batch, batch_size, batch_max_ms) if on_batch else None
+    validate = os.getenv(VALIDATE_STREAM_ENV, "0") == "1"
     
     def on_message(ws, message):
-        nonlocal last_pong_time, reconnect_attempts
-        
         try:
-            data = json.loads(message)
-            
-            if isinstance(data, str) and data == "ping":
-                ws.send("pong")
-                last_pong_time = time.time()
+            # Only closed klines are emitted, so skip decoding in-progress ticks
+            if isinstance(message, str) and _KLINE_OPEN_MARKER in message:
                 return
             
-            if "k" in data:
-                kline = data["k"]
-                
-                if kline.get("x", False):
-                    candle = OHLCV(
-                        timestamp=to_utc(datetime.fromtimestamp(kline["t"] / 1000)),
-                        open=float(kline["o"]),
-                        high=float(kline["h"]),
-                        low=float(kline["l"]),
-                        close=float(kline["c"]),
-                        volume=float(kline["v"]),
-                        symbol=symbol.upper(),
-                        timeframe=timeframe,
-                        asset_class=AssetClass.CRYPTO,
-                        source="binance",
-                    )
+            # Binance keep-alive uses ping/pong frames (see on_pong), never JSON
+            data = json_loads(message)
+            kline = parse_binance_kline(data)
+            if kline is not None:
+                candle = OHLCV(
+                    timestamp=datetime.fromtimestamp(kline.open_time / 1000, tz=timezone.utc),
+                    open=kline.open,
+                    high=kline.high,
+                    low=kline.low,
+                    close=kline.close,
+                    volume=kline.volume,
+                    symbol=kline.symbol,
+                    timeframe=timeframe,
+                    asset_class=AssetClass.CRYPTO,
+                    source="binance",
+                )
+                if validate:
                     validate_ohlcv(candle)
-                    
-                    if on_candle:
-                        on_candle(candle)
-                    else:
-                        timestamp_str = candle.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                        print(
-                            f"[{timestamp_str}] {candle.symbol} {candle.timeframe}: "
-                            f"O={candle.open:.8f} H={candle.high:.8f} "
-                            f"L={candle.low:.8f} C={candle.close:.8f} "
-                            f"V={candle.volume:.8f}"
-                        )
+                
+                if batcher is not None:
+                    batcher.add(candle)
+                elif on_candle:
+                    on_candle(candle)
+                else:
+                    print(format_stream_candle(candle))
         
         except json.JSONDecodeError as e:
             if on_error:
@@ -164,20 +368,21 @@ def stream_realtime_binance(
                 print(f"✗ Error processing message: {e}")
     
     def on_error_handler(ws, error):
-        nonlocal reconnect_attempts
-        reconnect_attempts += 1
+        nonlocal stopping
+        if isinstance(error, KeyboardInterrupt):
+            # run_forever swallows Ctrl+C after reporting it here and returns
+            # normally, so this flag is what ends the reconnect loop
+            stopping = True
+            return
         
         if on_error:
             on_error(error)
         else:
             print(f"✗ WebSocket error: {error}")
-        
-        if reconnect_attempts >= max_reconnect_attempts:
-            print(f"✗ Max reconnection attempts ({max_reconnect_attempts}) reached. Exiting.")
-            ws.close()
-            sys.exit(1)
     
     def on_close(ws, close_status_code, close_msg):
+        if batcher is not None:
+            batcher.close()
         if close_status_code:
             print(f"\n✗ WebSocket closed: {close_status_code} - {close_msg}")
         else:
@@ -201,29 +406,24 @@ def stream_realtime_binance(
         on_pong=on_pong,
     )
     
-    def ping_thread():
-        while ws.sock and ws.sock.connected:
-            time.sleep(20)
-            try:
-                ws.send("ping")
-            except:
-                break
-    
-    ping_thread_obj = threading.Thread(target=ping_thread, daemon=True)
-    ping_thread_obj.start()
-    
-    def signal_handler(sig, frame):
-        print("\n\nStopping WebSocket stream...")
-        ws.close()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    
     try:
-        ws.run_forever(ping_interval=20, ping_timeout=10)
+        # Keep-alive uses protocol-level ping frames sent by run_forever itself;
+        # only an unexpected close reconnects, Ctrl+C sets stopping
+        while True:
+            ws.run_forever(sockopt=_STREAM_SOCKOPT, ping_interval=20, ping_timeout=10)
+            if stopping:
+                break
+            reconnect_attempts += 1
+            delay = stream_reconnect_delay(reconnect_attempts)
+            print(f"Reconnecting in {delay}s (attempt {reconnect_attempts})...")
+            time.sleep(delay)
     except KeyboardInterrupt:
-        print("\n\nStopping WebSocket stream...")
-        ws.close()
+        pass  # Ctrl+C during the reconnect backoff
+    
+    print("\n\nStopping WebSocket stream...")
+    if batcher is not None:
+        batcher.close()
+    ws.close()
 
 
 def stream_realtime_twelvedata(
@@ -252,13 +452,11 @@ def stream_realtime_twelvedata(
     print("Press Ctrl+C to stop streaming\n")
     
     reconnect_attempts = 0
-    max_reconnect_attempts = 5
+    stopping = False
     
     def on_message(ws, message):
-        nonlocal reconnect_attempts
-        
         try:
-            data = json.loads(message)
+            data = json_loads(message)
             
             if data.get("event") == "subscribe-status":
                 if data.get("status") == "ok":
@@ -277,7 +475,9 @@ def stream_realtime_twelvedata(
             
             if data.get("event") == "price":
                 price_data = {
-                    "timestamp": datetime.fromtimestamp(data.get("timestamp", time.time())),
+                    "timestamp": datetime.fromtimestamp(
+                        data.get("timestamp", time.time()), tz=timezone.utc
+                    ),
                     "symbol": data.get("symbol", symbol_normalized),
                     "price": float(data.get("price", 0)),
                     "bid": float(data.get("bid", 0)) if "bid" in data else None,
@@ -288,7 +488,7 @@ def stream_realtime_twelvedata(
                 if on_price:
                     on_price(price_data)
                 else:
-                    timestamp_str = price_data["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
+                    timestamp_str = price_data["timestamp"].isoformat(" ", "seconds")[:19]
                     if asset_class == AssetClass.EQUITY:
                         price_str = f"${price_data['price']:.2f}"
                         if price_data["bid"] and price_data["ask"]:
@@ -313,18 +513,31 @@ def stream_realtime_twelvedata(
                 print(f"✗ Error processing message: {e}")
     
     def on_error_handler(ws, error):
-        nonlocal reconnect_attempts
-        reconnect_attempts += 1
+        nonlocal stopping
+        if isinstance(error, KeyboardInterrupt):
+            # run_forever swallows Ctrl+C after reporting it here and returns
+            # normally, so this flag is what ends the reconnect loop. The socket
+            # is only torn down after this callback, so unsubscribe now.
+            stopping = True
+            unsubscribe(ws)
+            return
         
         if on_error:
             on_error(error)
         else:
             print(f"✗ WebSocket error: {error}")
-        
-        if reconnect_attempts >= max_reconnect_attempts:
-            print(f"✗ Max reconnection attempts ({max_reconnect_attempts}) reached. Exiting.")
-            ws.close()
-            sys.exit(1)
+    
+    def unsubscribe(ws):
+        try:
+            unsubscribe_msg = {
+                "action": "unsubscribe",
+                "params": {
+                    "symbols": symbol_normalized
+                }
+            }
+            ws.send(json.dumps(unsubscribe_msg))
+        except:
+            pass
     
     def on_close(ws, close_status_code, close_msg):
         if close_status_code:
@@ -348,6 +561,22 @@ def stream_realtime_twelvedata(
             }
         }
         ws.send(json.dumps(subscribe_msg))
+        
+        # One heartbeat thread per connection, bound to this connection's socket:
+        # run_forever installs a new ws.sock on reconnect, and the old thread
+        # must exit rather than start beating on the new one
+        threading.Thread(target=heartbeat_thread, args=(ws, ws.sock), daemon=True).start()
+    
+    def heartbeat_thread(ws, sock):
+        while ws.sock is sock and sock.connected:
+            time.sleep(10)
+            if ws.sock is not sock:
+                break
+            try:
+                heartbeat_msg = {"action": "heartbeat"}
+                sock.send(json.dumps(heartbeat_msg))
+            except:
+                break
     
     ws = websocket.WebSocketApp(
         ws_url,
@@ -357,40 +586,34 @@ def stream_realtime_twelvedata(
         on_open=on_open,
     )
     
-    def heartbeat_thread():
-        while ws.sock and ws.sock.connected:
-            time.sleep(10)
-            try:
-                heartbeat_msg = {"action": "heartbeat"}
-                ws.send(json.dumps(heartbeat_msg))
-            except:
-                break
-    
-    heartbeat_thread_obj = threading.Thread(target=heartbeat_thread, daemon=True)
-    heartbeat_thread_obj.start()
-    
-    def signal_handler(sig, frame):
-        print("\n\nStopping WebSocket stream...")
-        try:
-            unsubscribe_msg = {
-                "action": "unsubscribe",
-                "params": {
-                    "symbols": symbol_normalized
-                }
-            }
-            ws.send(json.dumps(unsubscribe_msg))
-        except:
-            pass
-        ws.close()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    
     try:
-        ws.run_forever()
+        # Only an unexpected close reconnects; Ctrl+C sets stopping
+        while True:
+            ws.run_forever(sockopt=_STREAM_SOCKOPT)
+            if stopping:
+                break
+            reconnect_attempts += 1
+            delay = stream_reconnect_delay(reconnect_attempts)
+            print(f"Reconnecting in {delay}s (attempt {reconnect_attempts})...")
+            time.sleep(delay)
     except KeyboardInterrupt:
-        print("\n\nStopping WebSocket stream...")
-        ws.close()
+        pass  # Ctrl+C during the reconnect backoff
+    
+    print("\n\nStopping WebSocket stream...")
+    ws.close()
+
+
+# Row formats compiled once per asset class: timestamp and OHLC columns, then volume
+_TABLE_PRICE_FORMATS = {
+    AssetClass.EQUITY: "{:<20} ${:>10.2f} ${:>10.2f} ${:>10.2f} ${:>10.2f} ".format,
+    AssetClass.FOREX: "{:<20} {:>12.5f} {:>12.5f} {:>12.5f} {:>12.5f} ".format,
+    AssetClass.CRYPTO: "{:<20} {:>12.8f} {:>12.8f} {:>12.8f} {:>12.8f} ".format,
+}
+_TABLE_VOLUME_FORMATS = {
+    AssetClass.EQUITY: "{:>20,.0f}".format,
+    AssetClass.FOREX: "{:>20.8f}".format,
+    AssetClass.CRYPTO: "{:>20.8f}".format,
+}
 
 
 def format_ohlcv_table(data: List[OHLCV], asset_class: AssetClass = AssetClass.CRYPTO, indicator_data: Optional[List[Dict[str, Any]]] = None) -> str:
@@ -401,8 +624,9 @@ def format_ohlcv_table(data: List[OHLCV], asset_class: AssetClass = AssetClass.C
     # Build header
     header = f"{'Timestamp':<20} {'Open':>12} {'High':>12} {'Low':>12} {'Close':>12} {'Volume':>20}"
     
-    # Add indicator columns if present
-    if indicator_data and len(indicator_data) > 0:
+    # Indicator columns are the union of keys across rows, computed once
+    indicator_keys = []
+    if indicator_data:
         indicator_keys = sorted(set(key for row in indicator_data if row for key in row.keys()))
         for key in indicator_keys:
             header += f" {key.capitalize():>12}"
@@ -410,46 +634,23 @@ def format_ohlcv_table(data: List[OHLCV], asset_class: AssetClass = AssetClass.C
     lines.append(header)
     lines.append("=" * 100)
     
+    format_prices = _TABLE_PRICE_FORMATS[asset_class]
+    format_volume = _TABLE_VOLUME_FORMATS[asset_class]
+    indicator_count = len(indicator_data) if indicator_data else 0
     for idx, candle in enumerate(data):
-        timestamp_str = candle.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        
-        if asset_class == AssetClass.EQUITY:
-            open_str = f"${candle.open:>10.2f}"
-            high_str = f"${candle.high:>10.2f}"
-            low_str = f"${candle.low:>10.2f}"
-            close_str = f"${candle.close:>10.2f}"
-            volume_str = f"{candle.volume:>20,.0f}" if candle.volume else " " * 20
-        elif asset_class == AssetClass.FOREX:
-            open_str = f"{candle.open:>12.5f}"
-            high_str = f"{candle.high:>12.5f}"
-            low_str = f"{candle.low:>12.5f}"
-            close_str = f"{candle.close:>12.5f}"
-            volume_str = f"{candle.volume:>20.8f}" if candle.volume else " " * 20
-        else:  # CRYPTO
-            open_str = f"{candle.open:>12.8f}"
-            high_str = f"{candle.high:>12.8f}"
-            low_str = f"{candle.low:>12.8f}"
-            close_str = f"{candle.close:>12.8f}"
-            volume_str = f"{candle.volume:>20.8f}" if candle.volume else " " * 20
+        # isoformat is much cheaper than strftime; the first 19 chars are "YYYY-MM-DD HH:MM:SS"
+        timestamp_str = candle.timestamp.isoformat(" ")[:19]
         
-        row = (
-            f"{timestamp_str:<20} "
-            f"{open_str} "
-            f"{high_str} "
-            f"{low_str} "
-            f"{close_str} "
-            f"{volume_str}"
-        )
+        volume_str = format_volume(candle.volume) if candle.volume else " " * 20
+        row = format_prices(timestamp_str, candle.open, candle.high, candle.low, candle.close) + volume_str
         
         # Add indicator values if present
-        if indicator_data and idx < len(indicator_data) and indicator_data[idx]:
-            indicator_keys = sorted(set(key for row in indicator_data if row for key in row.keys()))
-            for key in indicator_keys:
-                val = indicator_data[idx].get(key) if idx < len(indicator_data) else None
-                if val is not None:
-                    row += f" {val:>12.8f}"
-                else:
-                    row += " " * 13
+        if idx < indicator_count and indicator_data[idx]:
+            values = indicator_data[idx]
+            row += "".join(
+                f" {values[key]:>12.8f}" if values.get(key) is not None else " " * 13
+                for key in indicator_keys
+            )
         
         lines.append(row)
     
@@ -462,7 +663,7 @@ def format_ohlcv_json(data: List[OHLCV], indicator_data: Optional[List[Dict[str,
     output = []
     for idx, candle in enumerate(data):
         row = {
-            "timestamp": candle.timestamp.isoformat(),
+            "timestamp": candle.timestamp,
             "open": candle.open,
             "high": candle.high,
             "low": candle.low,
@@ -475,7 +676,10 @@ def format_ohlcv_json(data: List[OHLCV], indicator_data: Optional[List[Dict[str,
             row.update(indicator_data[idx])
         
         output.append(row)
-    return json.dumps(output, indent=2)
+    if ORJSON_AVAILABLE:
+        # orjson serializes datetimes natively as ISO 8601
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(output, indent=2, default=datetime.isoformat)
 
 
 class StdoutSink:
@@ -523,35 +727,87 @@ class CSVSink:
                 "source"
             ]
             
-            # Add indicator columns if present
-            if self.indicator_data and len(self.indicator_data) > 0:
-                indicator_keys = sorted(set(key for row in self.indicator_data if row for key in row.keys()))
-                header.extend(indicator_keys)
+            # Indicator columns are the union of keys across rows, computed once
+            indicator_data = self.indicator_data or []
+            indicator_keys = sorted(set(key for row in indicator_data if row for key in row.keys()))
+            header.extend(indicator_keys)
             
             writer.writerow(header)
+            writer.writerows(self._rows(data, indicator_data, indicator_keys))
+
+    @staticmethod
+    def _rows(
+        data: List[OHLCV],
+        indicator_data: List[Dict[str, Any]],
+        indicator_keys: List[str],
+    ):
+        """Yield CSV rows; indicator cells are only added for rows with indicator values."""
+        indicator_count = len(indicator_data)
+        for idx, dp in enumerate(data):
+            row = [
+                dp.timestamp.isoformat(),
+                dp.open,
+                dp.high,
+                dp.low,
+                dp.close,
+                dp.volume,
+                dp.symbol,
+                dp.timeframe,
+                dp.asset_class.value,
+                dp.source
+            ]
+            
+            if idx < indicator_count and indicator_data[idx]:
+                values = indicator_data[idx]
+                row.extend(values.get(key) for key in indicator_keys)
+            
+            yield row
 
-            for idx, dp in enumerate(data):
-                row = [
-                    dp.timestamp.isoformat(),
-                    dp.open,
-                    dp.high,
-                    dp.low,
-                    dp.close,
-                    dp.volume,
-                    dp.symbol,
-                    dp.timeframe,
-                    dp.asset_class.value,
-                    dp.source
-                ]
-                
-                # Add indicator values if present
-                if self.indicator_data and idx < len(self.indicator_data) and self.indicator_data[idx]:
-                    indicator_keys = sorted(set(key for r in self.indicator_data if r for key in r.keys()))
-                    for key in indicator_keys:
-                        val = self.indicator_data[idx].get(key) if idx < len(self.indicator_data) else None
-                        row.append(val)
-                
-                writer.writerow(row)
+
+class ParquetSink:
+    """
+    Writes OHLCV data to a zstd-compressed Parquet file.
+
+    Prices are stored as float64 columns, so nothing is formatted to text and
+    downstream readers (pandas, NumPy, DuckDB) load them without re-parsing.
+    """
+    def __init__(self, path: str, indicator_data: Optional[List[Dict[str, Any]]] = None):
+        self.path = Path(path)
+        self.indicator_data = indicator_data
+
+    def write(self, data: List[OHLCV]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        columns: Dict[str, Any] = {
+            "timestamp": pa.array(
+                [round(dp.timestamp.timestamp() * 1000) for dp in data],
+                type=pa.timestamp("ms", tz="UTC"),
+            ),
+            "open": pa.array([dp.open for dp in data], type=pa.float64()),
+            "high": pa.array([dp.high for dp in data], type=pa.float64()),
+            "low": pa.array([dp.low for dp in data], type=pa.float64()),
+            "close": pa.array([dp.close for dp in data], type=pa.float64()),
+            "volume": pa.array([dp.volume for dp in data], type=pa.float64()),
+            "symbol": [dp.symbol for dp in data],
+            "timeframe": [dp.timeframe for dp in data],
+            "asset_class": [dp.asset_class.value for dp in data],
+            "source": [dp.source for dp in data],
+        }
+
+        # Same indicator columns as CSVSink; rows without values are null
+        indicator_data = self.indicator_data or []
+        indicator_keys = sorted(set(key for row in indicator_data if row for key in row.keys()))
+        indicator_count = len(indicator_data)
+        for key in indicator_keys:
+            columns[key] = pa.array(
+                [
+                    indicator_data[idx].get(key) if idx < indicator_count and indicator_data[idx] else None
+                    for idx in range(len(data))
+                ],
+                type=pa.float64(),
+            )
+
+        pq.write_table(pa.table(columns), self.path, compression="zstd")
 
 
 def load_indicator_cli(indicator_name: str) -> Optional[Callable[[List[OHLCV]], List[Dict[str, Any]]]]:
@@ -571,21 +827,18 @@ def load_indicator_cli(indicator_name: str) -> Optional[Callable[[List[OHLCV]],
 
 
 def parse_dates(start_str: Optional[str], end_str: Optional[str]) -> Tuple[Optional[datetime], Optional[datetime]]:
-    """Parse date strings to datetime objects."""
+    """Parse date strings to datetime objects; a date-only end covers the whole day."""
     if not start_str or not end_str:
         return None, None
     
     try:
+        # fromisoformat accepts both YYYY-MM-DD and YYYY-MM-DD HH:MM:SS in one call
+        start_dt = datetime.fromisoformat(start_str)
         try:
-            start_dt = datetime.strptime(start_str, "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            start_dt = datetime.strptime(start_str, "%Y-%m-%d")
-        
-        try:
-            end_dt = datetime.strptime(end_str, "%Y-%m-%d %H:%M:%S")
+            # Any date-only spelling (2024-01-02, 20240102) ends at the close of that day
+            end_dt = datetime.combine(date.fromisoformat(end_str), dt_time(23, 59, 59))
         except ValueError:
-            end_dt = datetime.strptime(end_str, "%Y-%m-%d")
-            end_dt = end_dt.replace(hour=23, minute=59, second=59)
+            end_dt = datetime.fromisoformat(end_str)
         
         return start_dt, end_dt
     
@@ -595,8 +848,18 @@ def parse_dates(start_str: Optional[str], end_str: Optional[str]) -> Tuple[Optio
         sys.exit(1)
 
 
+def load_env() -> None:
+    """Load environment variables from a .env file, if python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    load_dotenv()
+
+
 def main():
     """Main function."""
+    load_env()
     parser = argparse.ArgumentParser(
         description="Fetch OHLCV data from Binance (Crypto) or Twelve Data (Forex/Equities)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -613,6 +876,7 @@ Examples:
   
   # Real-time streaming
   python pull_ohlcv.py --symbol BTCUSDT --timeframe 1h --stream
+  python pull_ohlcv.py --symbol BTCUSDT,ETHUSDT,SOLUSDT --timeframe 1m --stream
   
   # Polling mode (Forex/Equities only)
   python pull_ohlcv.py --symbol EUR/USD --timeframe 1m --limit 1 --poll
@@ -623,7 +887,8 @@ Examples:
         "--symbol",
         type=str,
         required=True,
-        help="Symbol (e.g., BTCUSDT, EUR/USD, AAPL)",
+        help="Symbol (e.g., BTCUSDT, EUR/USD, AAPL). Crypto --stream also accepts a "
+        "comma-separated list (e.g., BTCUSDT,ETHUSDT) streamed over one connection",
     )
     
     parser.add_argument(
@@ -655,9 +920,9 @@ Examples:
     parser.add_argument(
         "--format",
         type=str,
-        choices=["table", "csv", "json"],
+        choices=["table", "csv", "json", "parquet"],
         default="table",
-        help="Output format (default: table). Ignored in streaming mode.",
+        help="Output format (default: table). csv and parquet write output.csv / output.parquet. Ignored in streaming mode.",
     )
     
     parser.add_argument(
@@ -711,6 +976,16 @@ Examples:
     if args.end and not args.start:
         parser.error("--start is required when --end is provided")
     
+    if args.format == "parquet" and not PYARROW_AVAILABLE:
+        parser.error("--format parquet requires pyarrow (pip install candlecraft[parquet])")
+    
+    symbols = [symbol.strip() for symbol in args.symbol.split(",") if symbol.strip()]
+    if len(symbols) > 1:
+        if asset_class != AssetClass.CRYPTO or not args.stream:
+            parser.error("Multiple symbols are only supported for crypto --stream")
+        if args.limit or args.start:
+            parser.error("Backfill (--limit/--start/--end) takes a single symbol")
+    
     # Parse dates
     start_dt, end_dt = parse_dates(args.start, args.end)
     
@@ -730,65 +1005,73 @@ Examples:
         print(f"Limit: {args.limit} candle(s) per request")
         print("Press Ctrl+C to stop polling\n")
         
-        def signal_handler(sig, frame):
-            print("\n\nStopping polling...")
-            sys.exit(0)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        
+        # Full window once, then only the most recent candles on each poll
+        window: Deque[OHLCV] = deque(maxlen=args.limit)
+        poll_started = time.monotonic()
         iteration = 0
-        while True:
-            iteration += 1
-            try:
-                print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Poll #{iteration}")
-                print("-" * 80)
-                
-                ohlcv_data = fetch_ohlcv(
-                    symbol=args.symbol,
-                    timeframe=args.timeframe,
-                    asset_class=asset_class,
-                    limit=args.limit,
-                    start=None,
-                    end=None,
-                    timezone=args.timezone,
-                )
+        try:
+            while True:
+                iteration += 1
+                try:
+                    print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Poll #{iteration}")
+                    print("-" * 80)
                 
-                # Calculate indicator if specified
-                indicator_data = None
-                if indicator_func:
-                    try:
-                        indicator_data = indicator_func(ohlcv_data)
-                    except Exception as e:
-                        print(f"✗ Error calculating indicator: {e}")
-                        indicator_data = None
+                    fresh = fetch_ohlcv(
+                        symbol=args.symbol,
+                        timeframe=args.timeframe,
+                        asset_class=asset_class,
+                        limit=args.limit if not window else min(args.limit, POLL_REFRESH_LIMIT),
+                        start=None,
+                        end=None,
+                        timezone=args.timezone,
+                    )
                 
-                if args.format == "table":
-                    if indicator_data:
-                        print(format_ohlcv_table(ohlcv_data, asset_class, indicator_data))
-                    else:
-                        sink = StdoutSink(lambda data: format_ohlcv_table(data, asset_class))
-                        sink.write(ohlcv_data)
-                elif args.format == "csv":
-                    sink = CSVSink("output.csv", indicator_data)
-                    sink.write(ohlcv_data)
-                else:
-                    if indicator_data:
-                        print(format_ohlcv_json(ohlcv_data, indicator_data))
+                    if not merge_candles(window, fresh):
+                        print("No new candle since last poll")
                     else:
-                        sink = StdoutSink(format_ohlcv_json)
-                        sink.write(ohlcv_data)
+                        ohlcv_data = list(window)
+                    
+                        # Calculate indicator if specified
+                        indicator_data = None
+                        if indicator_func:
+                            try:
+                                indicator_data = indicator_func(ohlcv_data)
+                            except Exception as e:
+                                print(f"✗ Error calculating indicator: {e}")
+                                indicator_data = None
+                    
+                        if args.format == "table":
+                            if indicator_data:
+                                print(format_ohlcv_table(ohlcv_data, asset_class, indicator_data))
+                            else:
+                                sink = StdoutSink(lambda data: format_ohlcv_table(data, asset_class))
+                                sink.write(ohlcv_data)
+                        elif args.format == "csv":
+                            sink = CSVSink("output.csv", indicator_data)
+                            sink.write(ohlcv_data)
+                        elif args.format == "parquet":
+                            sink = ParquetSink("output.parquet", indicator_data)
+                            sink.write(ohlcv_data)
+                        else:
+                            if indicator_data:
+                                print(format_ohlcv_json(ohlcv_data, indicator_data))
+                            else:
+                                sink = StdoutSink(format_ohlcv_json)
+                                sink.write(ohlcv_data)
                 
-                print(f"\n⏳ Waiting 60 seconds before next poll...")
-                print("   (Press Ctrl+C to stop)")
-                time.sleep(60)
+                    print(f"\n⏳ Waiting until next poll ({POLL_INTERVAL_SECONDS}s interval)...")
+                    print("   (Press Ctrl+C to stop)")
             
-            except KeyboardInterrupt:
-                print("\n\nStopping polling...")
-                sys.exit(0)
-            except Exception as e:
-                print(f"✗ Error during polling: {e}")
-                print("   Retrying in 60 seconds...")
-                time.sleep(60)
+                except Exception as e:
+                    print(f"✗ Error during polling: {e}")
+                    print("   Retrying at next poll...")
+            
+                # Sleep to the next tick of a fixed schedule so fetch time doesn't accumulate drift
+                next_tick = poll_started + iteration * POLL_INTERVAL_SECONDS
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+        except KeyboardInterrupt:
+            print("\n\nStopping polling...")
+            sys.exit(0)
     
     # Handle streaming mode
     elif args.stream:
@@ -820,21 +1103,31 @@ Examples:
                     print(f"✗ Error calculating indicator: {e}")
                     indicator_data = None
             
-            if args.format == "table":
-                if indicator_data:
-                    print(format_ohlcv_table(ohlcv_data, asset_class, indicator_data))
-                else:
-                    sink = StdoutSink(lambda data: format_ohlcv_table(data, asset_class))
-                    sink.write(ohlcv_data)
-            elif args.format == "csv":
+            if args.format == "csv":
                 sink = CSVSink("output.csv", indicator_data)
                 sink.write(ohlcv_data)
+            elif args.format == "parquet":
+                sink = ParquetSink("output.parquet", indicator_data)
+                sink.write(ohlcv_data)
             else:
-                if indicator_data:
-                    print(format_ohlcv_json(ohlcv_data, indicator_data))
+                # Print only the tail so the stream subscribes without waiting
+                # on a full backfill table; indicators still use every candle
+                tail = ohlcv_data[-STREAM_BACKFILL_TAIL:]
+                tail_indicators = indicator_data[-STREAM_BACKFILL_TAIL:] if indicator_data else None
+                if len(tail) < len(ohlcv_data):
+                    print(f"(showing last {len(tail)} of {len(ohlcv_data)} candles)")
+                if args.format == "table":
+                    if tail_indicators:
+                        print(format_ohlcv_table(tail, asset_class, tail_indicators))
+                    else:
+                        sink = StdoutSink(lambda data: format_ohlcv_table(data, asset_class))
+                        sink.write(tail)
                 else:
-                    sink = StdoutSink(format_ohlcv_json)
-                    sink.write(ohlcv_data)
+                    if tail_indicators:
+                        print(format_ohlcv_json(tail, tail_indicators))
+                    else:
+                        sink = StdoutSink(format_ohlcv_json)
+                        sink.write(tail)
             
             print("\n" + "=" * 80)
             print("STARTING REAL-TIME STREAMING")
@@ -846,26 +1139,20 @@ Examples:
                 sys.exit(1)
             
             def on_new_candle(candle: OHLCV):
-                timestamp_str = candle.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                print(
-                    f"[{timestamp_str}] {candle.symbol} {candle.timeframe}: "
-                    f"O={candle.open:.8f} H={candle.high:.8f} "
-                    f"L={candle.low:.8f} C={candle.close:.8f} "
-                    f"V={candle.volume:.8f}"
-                )
+                print(format_stream_candle(candle))
             
             def on_error_handler(error: Exception):
                 print(f"✗ Streaming error: {error}")
             
-            stream_realtime_binance(
-                symbol=args.symbol,
+            stream_realtime_binance_multi(
+                symbols,
                 timeframe=args.timeframe,
                 on_candle=on_new_candle,
                 on_error=on_error_handler,
             )
         else:
             def on_new_price(price_data: Dict[str, Any]):
-                timestamp_str = price_data["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
+                timestamp_str = price_data["timestamp"].isoformat(" ", "seconds")[:19]
                 if asset_class == AssetClass.EQUITY:
                     price_str = f"${price_data['price']:.2f}"
                     if price_data.get("bid") and price_data.get("ask"):
@@ -918,6 +1205,9 @@ Examples:
         elif args.format == "csv":
             sink = CSVSink("output.csv", indicator_data)
             sink.write(ohlcv_data)
+        elif args.format == "parquet":
+            sink = ParquetSink("output.parquet", indicator_data)
+            sink.write(ohlcv_data)
         else:
             if indicator_data:
                 print(format_ohlcv_json(ohlcv_data, indicator_data))
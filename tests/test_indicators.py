@@ -8,6 +8,7 @@ Uses static test data - NO external API calls.
 from datetime import datetime, timezone
 from typing import List
 
+import numpy as np
 import pytest
 
 from candlecraft import OHLCV, AssetClass, load_indicator
@@ -410,6 +411,53 @@ class TestOBV:
         assert all(r["obv"] is None for r in result)
 
 
+# ============================================================================
+# Heikin-Ashi Tests
+# ============================================================================
+
+class TestHeikinAshi:
+    """Test Heikin-Ashi candle formula correctness and edge cases."""
+
+    def test_heikin_ashi_recurrence(self):
+        """Test HA open/close follow the recursive definition."""
+        data = create_ohlcv_data([100.0, 102.0, 101.0, 104.0])
+        calculate = load_indicator("heikin_ashi")
+        result = calculate(data)
+
+        assert len(result) == len(data)
+        first = data[0]
+        assert result[0]["ha_open"] == pytest.approx((first.open + first.close) / 2)
+        for i in range(1, len(data)):
+            c = data[i]
+            assert result[i]["ha_close"] == pytest.approx((c.open + c.high + c.low + c.close) / 4)
+            expected_open = (result[i - 1]["ha_open"] + result[i - 1]["ha_close"]) / 2
+            assert result[i]["ha_open"] == pytest.approx(expected_open)
+
+    def test_heikin_ashi_bounds(self):
+        """Test HA high/low envelope HA open/close."""
+        data = create_ohlcv_data([100.0 + (i % 7) * 0.8 for i in range(30)])
+        calculate = load_indicator("heikin_ashi")
+        result = calculate(data)
+
+        for r in result:
+            assert r["ha_high"] >= max(r["ha_open"], r["ha_close"])
+            assert r["ha_low"] <= min(r["ha_open"], r["ha_close"])
+
+    def test_heikin_ashi_empty(self):
+        """Test Heikin-Ashi with empty data."""
+        calculate = load_indicator("heikin_ashi")
+        assert calculate([]) == []
+
+    def test_heikin_ashi_empty_pure_python(self):
+        """Test the Heikin-Ashi kernel on empty input without Numba's unchecked indexing."""
+        from candlecraft.indicators.heikin_ashi import _heikin_ashi
+
+        kernel = getattr(_heikin_ashi, "py_func", _heikin_ashi)
+        empty = np.empty(0)
+        for column in kernel(empty, empty, empty, empty):
+            assert column.shape == (0,)
+
+
 # ============================================================================
 # Edge Cases and Data Integrity Tests
 # ============================================================================
@@ -482,3 +530,192 @@ class TestIndicatorEdgeCases:
             result = calculate(data)
             # Result length must match input length
             assert len(result) == len(data), f"{indicator_name} alignment failed"
+
+
+# ============================================================================
+# Incremental State Tests
+# ============================================================================
+
+class TestIncrementalState:
+    """Streaming state classes must reproduce calculate() bar by bar."""
+
+    PRICES = [100.0 + (i % 7) * 1.5 - (i % 3) * 2.0 for i in range(60)]
+
+    def _assert_matches(self, expected, actual):
+        assert len(expected) == len(actual)
+        for e, a in zip(expected, actual):
+            if e is None:
+                assert a is None
+            else:
+                assert a == pytest.approx(e, abs=1e-6)
+
+    def test_sma_ema_rsi_state(self):
+        """Close-only states match their batch indicators."""
+        from candlecraft.indicators.ema import EmaState
+        from candlecraft.indicators.rsi import RsiState
+        from candlecraft.indicators.sma import SmaState
+
+        data = create_ohlcv_data(self.PRICES)
+        for name, state in [
+            ("sma", SmaState(10)),
+            ("ema", EmaState(10)),
+            ("rsi", RsiState(10)),
+        ]:
+            expected = [r[name] for r in load_indicator(name)(data, period=10)]
+            actual = [state.update(c.close) for c in data]
+            self._assert_matches(expected, actual)
+
+    def test_bollinger_state(self):
+        """Bollinger state matches the batch indicator."""
+        from candlecraft.indicators.bollinger import BollingerState
+
+        data = create_ohlcv_data(self.PRICES)
+        state = BollingerState(20)
+        expected = load_indicator("bollinger")(data)
+        actual = [state.update(c.close) for c in data]
+        for e, a in zip(expected, actual):
+            if e["bb_middle"] is None:
+                assert a is None
+            else:
+                assert a == pytest.approx(e, abs=1e-6)
+
+    def test_atr_state(self):
+        """ATR state matches the batch indicator."""
+        from candlecraft.indicators.atr import AtrState
+
+        data = create_ohlcv_data(self.PRICES)
+        state = AtrState(14)
+        expected = [r["atr"] for r in load_indicator("atr")(data)]
+        actual = [state.update(c.high, c.low, c.close) for c in data]
+        self._assert_matches(expected, actual)
+
+    def test_volume_states(self):
+        """OBV and VWAP states match the batch indicators, including missing volume."""
+        from candlecraft.indicators.obv import ObvState
+        from candlecraft.indicators.vwap import VwapState
+
+        volumes = [None if i % 5 == 0 else float(100 + i) for i in range(len(self.PRICES))]
+        data = create_ohlcv_data(self.PRICES)
+        for candle, volume in zip(data, volumes):
+            candle.volume = volume
+
+        obv, vwap = ObvState(), VwapState()
+        self._assert_matches(
+            [r["obv"] for r in load_indicator("obv")(data)],
+            [obv.update(c.close, c.volume) for c in data],
+        )
+        self._assert_matches(
+            [r["vwap"] for r in load_indicator("vwap")(data)],
+            [vwap.update(c.high, c.low, c.close, c.volume) for c in data],
+        )
+
+
+# ============================================================================
+# Columnar Result Tests
+# ============================================================================
+
+class TestIndicatorResult:
+    """compute() returns columnar arrays equivalent to calculate()."""
+
+    @pytest.mark.parametrize("name", [
+        "macd", "rsi", "sma", "ema", "bollinger", "atr",
+        "stochastic", "adx", "vwap", "obv", "heikin_ashi",
+    ])
+    def test_compute_matches_calculate(self, name):
+        """Iterating the result yields calculate()'s dictionaries."""
+        import importlib
+
+        data = create_ohlcv_data([100.0 + (i % 9) - (i % 4) * 0.5 for i in range(60)])
+        module = importlib.import_module(f"candlecraft.indicators.{name}")
+        result = module.compute(data)
+
+        assert len(result) == len(data)
+        assert list(result) == module.calculate(data)
+        assert result[len(data) - 1] == module.calculate(data)[-1]
+
+    def test_compute_accepts_batch(self):
+        """An OHLCVBatch gives the same result as the equivalent candle list."""
+        import numpy as np
+
+        from candlecraft import OHLCVBatch
+        from candlecraft.indicators import atr, vwap
+
+        data = create_ohlcv_data([100.0 + (i % 6) for i in range(30)])
+        batch = OHLCVBatch(
+            timestamp=np.array([c.timestamp.replace(tzinfo=None) for c in data], "datetime64[ms]"),
+            open=np.array([c.open for c in data]),
+            high=np.array([c.high for c in data]),
+            low=np.array([c.low for c in data]),
+            close=np.array([c.close for c in data]),
+            volume=np.array([c.volume for c in data]),
+            symbol="TEST",
+            timeframe="1h",
+            asset_class=AssetClass.CRYPTO,
+            source="test",
+        )
+        assert atr.calculate(batch) == atr.calculate(data)
+        assert vwap.calculate(batch) == vwap.calculate(data)
+
+    def test_to_records(self):
+        """Record array exposes each output column by name."""
+        from candlecraft.indicators import macd
+
+        data = create_ohlcv_data([100.0 + i for i in range(40)])
+        records = macd.compute(data).to_records()
+        assert records.dtype.names == ("macd", "signal", "histogram")
+        assert len(records) == 40
+
+
+# ============================================================================
+# Pipeline Tests
+# ============================================================================
+
+class TestIndicatorPipeline:
+    """IndicatorPipeline shares inputs and matches per-indicator results."""
+
+    def test_pipeline_matches_calculate(self):
+        """Every supported indicator returns the same values as calculate()."""
+        from candlecraft.indicators import IndicatorPipeline
+
+        data = create_ohlcv_data([100.0 + (i % 11) - (i % 5) * 0.7 for i in range(80)])
+        pipeline = IndicatorPipeline(data)
+        for name in [
+            "macd", "rsi", "sma", "ema", "bollinger", "atr",
+            "stochastic", "adx", "vwap", "obv", "heikin_ashi",
+        ]:
+            assert pipeline.calculate(name) == load_indicator(name)(data), name
+
+    def test_pipeline_reuses_results(self):
+        """True Range and results are computed once and memoised."""
+        from candlecraft.indicators import IndicatorPipeline
+
+        data = create_ohlcv_data([100.0 + i for i in range(30)])
+        pipeline = IndicatorPipeline(data)
+        assert pipeline.compute("atr", period=5) is pipeline.compute("atr", period=5)
+        tr = pipeline.true_ranges
+        pipeline.compute("adx", period=5)
+        assert pipeline.true_ranges is tr
+        assert pipeline.calculate("sma", period=5) == load_indicator("sma")(data, period=5)
+
+    def test_pipeline_float32(self):
+        """Single-precision inputs stay close to the float64 results."""
+        import numpy as np
+
+        from candlecraft.indicators import IndicatorPipeline
+
+        data = create_ohlcv_data([100.0 + (i % 11) - (i % 5) * 0.7 for i in range(80)])
+        exact = IndicatorPipeline(data)
+        fast = IndicatorPipeline(data, dtype=np.float32)
+        for name in ["sma", "ema", "atr", "macd", "vwap", "obv"]:
+            for column, values in fast.compute(name).columns.items():
+                assert values.dtype == np.float64
+                np.testing.assert_allclose(
+                    values, exact.compute(name).columns[column], rtol=1e-5, atol=1e-3
+                )
+
+    def test_pipeline_unknown_indicator(self):
+        """Unsupported names raise ValueError."""
+        from candlecraft.indicators import IndicatorPipeline
+
+        with pytest.raises(ValueError, match="Unsupported indicator"):
+            IndicatorPipeline([]).compute("nope")
@@ -0,0 +1,281 @@
+"""Unit tests for pull_ohlcv.py CLI helpers (no live API calls)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import pull_ohlcv
+from candlecraft import OHLCV, AssetClass
+from pull_ohlcv import (
+    CandleBatcher,
+    ParquetSink,
+    main,
+    merge_candles,
+    parse_binance_kline,
+    parse_dates,
+    stream_realtime_binance_multi,
+    stream_realtime_twelvedata,
+)
+
+
+@pytest.mark.parametrize("end_str", ["2024-01-02", "20240102"])
+def test_parse_dates_date_only_end_covers_whole_day(end_str):
+    start_dt, end_dt = parse_dates("2024-01-01", end_str)
+    assert start_dt == datetime(2024, 1, 1)
+    assert end_dt == datetime(2024, 1, 2, 23, 59, 59)
+
+
+def test_parse_dates_keeps_explicit_end_time():
+    _, end_dt = parse_dates("2024-01-01", "2024-01-02 10:30:00")
+    assert end_dt == datetime(2024, 1, 2, 10, 30)
+
+
+def test_parse_dates_invalid_exits():
+    with pytest.raises(SystemExit):
+        parse_dates("2024-01-01", "not a date")
+
+
+def _candle(hour: int, close: float = 100.0) -> OHLCV:
+    return OHLCV(
+        timestamp=datetime(2024, 1, 1, hour, tzinfo=timezone.utc),
+        open=close,
+        high=close + 1.0,
+        low=close - 1.0,
+        close=close,
+        volume=1.0,
+        symbol="BTCUSDT",
+        timeframe="1h",
+        asset_class=AssetClass.CRYPTO,
+        source="test",
+    )
+
+
+def test_candle_batcher_flushes_when_full():
+    batches = []
+    batcher = CandleBatcher(batches.append, max_n=2, max_ms=60_000)
+    for hour in range(5):
+        batcher.add(_candle(hour))
+    assert [[c.timestamp.hour for c in batch] for batch in batches] == [[0, 1], [2, 3]]
+    batcher.close()
+    assert [c.timestamp.hour for c in batches[-1]] == [4]
+
+
+def test_candle_batcher_flushes_after_max_ms():
+    flushed = threading.Event()
+    batches = []
+
+    def flush_fn(batch):
+        batches.append(batch)
+        flushed.set()
+
+    batcher = CandleBatcher(flush_fn, max_n=10, max_ms=50)
+    batcher.add(_candle(0))
+    batcher.add(_candle(1))
+    assert flushed.wait(timeout=2)
+    assert [[c.timestamp.hour for c in batch] for batch in batches] == [[0, 1]]
+
+
+def test_candle_batcher_close_drains_pending():
+    batches = []
+    batcher = CandleBatcher(batches.append, max_n=10, max_ms=60_000)
+    batcher.add(_candle(0))
+    batcher.close()
+    assert len(batches) == 1 and batches[0][0].timestamp.hour == 0
+    batcher.close()
+    assert len(batches) == 1
+
+
+def test_candle_batcher_rejects_empty_batches():
+    with pytest.raises(ValueError):
+        CandleBatcher(lambda batch: None, max_n=0)
+
+
+def test_merge_candles_sorts_newest_first_input():
+    window = deque(maxlen=10)
+    assert merge_candles(window, [_candle(2), _candle(1), _candle(0)])
+    assert [c.timestamp.hour for c in window] == [0, 1, 2]
+
+
+def test_merge_candles_replaces_forming_last_candle():
+    window = deque([_candle(0), _candle(1, close=100.0)], maxlen=10)
+    assert not merge_candles(window, [_candle(1, close=105.0)])
+    assert len(window) == 2
+    assert window[-1].close == 105.0
+
+
+def test_merge_candles_appends_only_newer_timestamps():
+    window = deque([_candle(0, close=100.0), _candle(1)], maxlen=10)
+    assert merge_candles(window, [_candle(0, close=50.0), _candle(1), _candle(2)])
+    assert [c.timestamp.hour for c in window] == [0, 1, 2]
+    assert window[0].close == 100.0
+
+
+def test_merge_candles_reports_no_new_candle():
+    window = deque([_candle(0), _candle(1)], maxlen=10)
+    assert not merge_candles(window, [])
+    assert not merge_candles(window, [_candle(0), _candle(1)])
+    assert [c.timestamp.hour for c in window] == [0, 1]
+
+
+def _kline_event(symbol: str, closed: bool = True, close: str = "101.5") -> dict:
+    return {
+        "e": "kline",
+        "s": symbol,
+        "k": {
+            "t": 1704067200000,
+            "s": symbol,
+            "o": "100.0",
+            "h": "102.0",
+            "l": "99.0",
+            "c": close,
+            "v": "12.5",
+            "x": closed,
+        },
+    }
+
+
+def test_parse_binance_kline_unwraps_combined_stream_envelope():
+    event = _kline_event("ETHUSDT")
+    envelope = {"stream": "ethusdt@kline_1m", "data": event}
+    kline = parse_binance_kline(envelope)
+    assert kline == parse_binance_kline(event)
+    assert kline.symbol == "ETHUSDT"
+    assert kline.open_time == 1704067200000
+    assert kline.close == 101.5
+
+
+def test_parse_binance_kline_skips_open_kline():
+    event = _kline_event("BTCUSDT", closed=False)
+    assert parse_binance_kline(event) is None
+    assert parse_binance_kline({"stream": "btcusdt@kline_1m", "data": event}) is None
+
+
+@pytest.mark.parametrize("payload", [None, [], {"result": None, "id": 1}, {"data": "oops"}])
+def test_parse_binance_kline_ignores_non_kline_messages(payload):
+    assert parse_binance_kline(payload) is None
+
+
+def test_parse_binance_kline_rejects_malformed_closed_kline():
+    missing = _kline_event("BTCUSDT")
+    del missing["k"]["c"]
+    with pytest.raises(ValueError, match="Malformed"):
+        parse_binance_kline(missing)
+    with pytest.raises(ValueError, match="Malformed"):
+        parse_binance_kline(_kline_event("BTCUSDT", close="n/a"))
+
+
+def _install_fake_websocket(monkeypatch, messages):
+    """Replace WebSocketApp with a fake that replays messages, then reports Ctrl+C."""
+    apps = []
+
+    class FakeWebSocketApp:
+        def __init__(self, url, **callbacks):
+            self.url = url
+            self.callbacks = callbacks
+            self.run_count = 0
+            self.sent = []
+            self.sock = SimpleNamespace(connected=False)
+            apps.append(self)
+
+        def run_forever(self, **kwargs):
+            self.run_count += 1
+            if "on_open" in self.callbacks:
+                self.callbacks["on_open"](self)
+            for message in messages:
+                self.callbacks["on_message"](self, message)
+            # Like websocket-client: Ctrl+C is reported to on_error, then run_forever returns
+            self.callbacks["on_error"](self, KeyboardInterrupt())
+            return True
+
+        def send(self, data):
+            self.sent.append(json.loads(data))
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(pull_ohlcv.websocket, "WebSocketApp", FakeWebSocketApp)
+    return apps
+
+
+_COMBINED_MESSAGES = [
+    json.dumps({"stream": "btcusdt@kline_1m", "data": _kline_event("BTCUSDT", close="101.0")}),
+    json.dumps({"stream": "ethusdt@kline_1m", "data": _kline_event("ETHUSDT", closed=False)}),
+    json.dumps({"stream": "ethusdt@kline_1m", "data": _kline_event("ETHUSDT", close="2.5")}),
+]
+
+
+def test_stream_binance_multi_routes_candles_by_symbol(monkeypatch, capsys):
+    apps = _install_fake_websocket(monkeypatch, _COMBINED_MESSAGES)
+    candles, errors = [], []
+    stream_realtime_binance_multi(
+        ["btcusdt", "ETHUSDT", "BTCUSDT"], "1m", on_candle=candles.append, on_error=errors.append
+    )
+
+    assert len(apps) == 1
+    assert apps[0].run_count == 1
+    assert "Reconnecting" not in capsys.readouterr().out
+    assert apps[0].url.endswith("streams=btcusdt@kline_1m/ethusdt@kline_1m")
+    assert errors == []
+    assert [(c.symbol, c.close) for c in candles] == [("BTCUSDT", 101.0), ("ETHUSDT", 2.5)]
+
+
+def test_stream_binance_stops_on_ctrl_c_and_drains_batcher(monkeypatch, capsys):
+    apps = _install_fake_websocket(monkeypatch, _COMBINED_MESSAGES)
+    batches = []
+    stream_realtime_binance_multi(
+        ["BTCUSDT", "ETHUSDT"], "1m", on_batch=batches.append, batch_size=50, batch_max_ms=60_000
+    )
+
+    assert apps[0].run_count == 1
+    assert "Reconnecting" not in capsys.readouterr().out
+    assert [[c.symbol for c in batch] for batch in batches] == [["BTCUSDT", "ETHUSDT"]]
+
+
+def test_stream_twelvedata_unsubscribes_and_stops_on_ctrl_c(monkeypatch, capsys):
+    monkeypatch.setenv("TWELVEDATA_SECRET", "test-key")
+    price = json.dumps({"event": "price", "symbol": "EUR/USD", "price": 1.1, "timestamp": 0})
+    apps = _install_fake_websocket(monkeypatch, [price])
+    prices = []
+    stream_realtime_twelvedata("EUR/USD", AssetClass.FOREX, on_price=prices.append)
+
+    assert apps[0].run_count == 1
+    assert "Reconnecting" not in capsys.readouterr().out
+    assert [msg["action"] for msg in apps[0].sent] == ["subscribe", "unsubscribe"]
+    assert [p["price"] for p in prices] == [1.1]
+
+
+def test_parquet_sink_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    candles = [_candle(0, close=100.0), _candle(1, close=101.0)]
+    path = tmp_path / "out" / "candles.parquet"
+    ParquetSink(str(path), [None, {"rsi": 55.5}]).write(candles)
+
+    table = pq.read_table(path)
+    assert table.column_names == [
+        "timestamp", "open", "high", "low", "close", "volume",
+        "symbol", "timeframe", "asset_class", "source", "rsi",
+    ]
+    rows = table.to_pylist()
+    assert [row["timestamp"] for row in rows] == [c.timestamp for c in candles]
+    assert [row["close"] for row in rows] == [100.0, 101.0]
+    assert rows[0]["asset_class"] == "crypto"
+    assert [row["rsi"] for row in rows] == [None, 55.5]
+
+
+def test_parquet_format_without_pyarrow_is_a_cli_error(monkeypatch, capsys):
+    monkeypatch.setattr(pull_ohlcv, "PYARROW_AVAILABLE", False)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["pull_ohlcv.py", "--symbol", "BTCUSDT", "--timeframe", "1h", "--limit", "5",
+         "--format", "parquet"],
+    )
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 2
+    assert "requires pyarrow" in capsys.readouterr().err
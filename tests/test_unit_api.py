@@ -2,24 +2,28 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import os
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from candlecraft import (
     OHLCV,
     AssetClass,
+    OHLCVBatch,
     Provider,
     RateLimitException,
     fetch_ohlcv,
+    fetch_ohlcv_many,
     list_indicators,
     load_indicator,
 )
 from candlecraft.api import is_provider_available
 from candlecraft.providers import fetch_ohlcv_binance, fetch_ohlcv_twelvedata
-from candlecraft.utils import detect_asset_class, validate_ohlcv
+from candlecraft.utils import detect_asset_class, validate_ohlcv, validate_ohlcv_batch
 
 
 def _sample_candle(close: float = 100.0) -> OHLCV:
@@ -71,6 +75,16 @@ class TestValidateOhlcv:
         with pytest.raises(ValueError, match="non-positive"):
             validate_ohlcv(candle)
 
+    def test_batch_reports_first_invalid_row(self):
+        open_ = np.array([100.0, 100.0, 100.0])
+        high = np.array([101.0, 99.0, 90.0])
+        low = np.array([99.0, 98.0, 95.0])
+        close = np.array([100.5, 100.5, 100.5])
+
+        validate_ohlcv_batch(open_[:1], high[:1], low[:1], close[:1])
+        with pytest.raises(ValueError, match="Invalid OHLCV at row 1"):
+            validate_ohlcv_batch(open_, high, low, close)
+
 
 class TestIndicatorsPackage:
     def test_list_indicators_returns_packaged_modules(self):
@@ -95,6 +109,22 @@ class TestIndicatorsPackage:
         with pytest.raises(FileNotFoundError, match="Indicator module not found"):
             load_indicator("not_a_real_indicator")
 
+    def test_custom_dir_indicator_cached_until_modified(self, tmp_path):
+        module_file = tmp_path / "custom.py"
+        module_file.write_text("def calculate(data):\n    return [1]\n")
+
+        first = load_indicator("custom", indicators_dir=tmp_path)
+        assert load_indicator("custom", indicators_dir=tmp_path) is first
+        assert list_indicators(tmp_path) == ["custom"]
+
+        module_file.write_text("def calculate(data):\n    return [2]\n")
+        stat = module_file.stat()
+        os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = load_indicator("custom", indicators_dir=tmp_path)
+        assert reloaded is not first
+        assert reloaded([]) == [2]
+
 
 class TestFetchOhlcvBinanceMocked:
     def test_fetch_limit(self):
@@ -111,6 +141,191 @@ class TestFetchOhlcvBinanceMocked:
         assert result[0].symbol == "BTCUSDT"
         assert result[0].close == 100.5
         assert result[0].source == "binance"
+        assert result[0].timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert result[0].volume == 1234.0
+
+    def test_fetch_skips_ping_and_maps_connection_errors(self):
+        import requests
+
+        client = MagicMock()
+        client.get_klines.side_effect = requests.exceptions.ConnectionError("unreachable")
+
+        with pytest.raises(ConnectionError, match="Binance connection failed"):
+            fetch_ohlcv_binance(client, "BTCUSDT", "1h", limit=1)
+        client.ping.assert_not_called()
+
+    def test_fetch_return_batch(self):
+        client = MagicMock()
+        client.get_klines.return_value = [
+            [1704067200000, "100", "101", "99", "100.5", "1234"],
+            [1704070800000, "100.5", "102", "100", "101.5", "10"],
+        ]
+
+        batch = fetch_ohlcv_binance(client, "btcusdt", "1h", limit=2, return_batch=True)
+
+        assert isinstance(batch, OHLCVBatch)
+        assert len(batch) == 2
+        assert batch.close.tolist() == [100.5, 101.5]
+        assert batch.to_ohlcv()[0].timestamp == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert batch[-1] == batch.to_ohlcv()[-1]
+        assert list(batch) == batch.to_ohlcv()
+
+    def test_fetch_return_batch_validates(self):
+        client = MagicMock()
+        client.get_klines.return_value = [
+            [1704067200000, "100", "101", "99", "100.5", "1234"],
+            [1704070800000, "100.5", "99", "100", "101.5", "10"],
+        ]
+
+        with pytest.raises(RuntimeError, match="Invalid OHLCV at row 1"):
+            fetch_ohlcv_binance(client, "BTCUSDT", "1h", limit=2, return_batch=True)
+        with pytest.raises(RuntimeError, match="Invalid OHLCV at row 1"):
+            fetch_ohlcv_binance(client, "BTCUSDT", "1h", limit=2)
+
+    def test_fetch_range_is_sharded_into_windows(self):
+        hour_ms = 3_600_000
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 3, 15, tzinfo=timezone.utc)  # > 1000 hourly candles
+
+        def get_klines(symbol, interval, startTime, endTime, limit):
+            return [
+                [t, "100", "101", "99", "100.5", "1"]
+                for t in range(startTime, endTime + 1, hour_ms)
+            ]
+
+        client = MagicMock()
+        client.get_klines.side_effect = get_klines
+
+        result = fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=end)
+
+        windows = [
+            (c.kwargs["startTime"], c.kwargs["endTime"]) for c in client.get_klines.call_args_list
+        ]
+        assert len(windows) == 2
+        assert sorted(windows)[0][1] + 1 == sorted(windows)[1][0]
+        timestamps = [c.timestamp for c in result]
+        assert timestamps == sorted(set(timestamps))
+        assert timestamps[0] == start
+        assert timestamps[-1] == end
+
+    def test_fetch_range_includes_end_candle_on_window_boundary(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(hours=1000)  # exactly one window span
+
+        def get_klines(symbol, interval, startTime, endTime, limit):
+            return [
+                [t, "100", "101", "99", "100.5", "1"]
+                for t in range(startTime, endTime + 1, 3_600_000)
+            ]
+
+        client = MagicMock()
+        client.get_klines.side_effect = get_klines
+
+        result = fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=end)
+
+        assert len(result) == 1001
+        assert result[-1].timestamp == end
+
+    def test_fetch_range_with_equal_start_and_end(self):
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        client = MagicMock()
+        client.get_klines.return_value = [
+            [int(start.timestamp() * 1000), "100", "101", "99", "100.5", "1"],
+        ]
+
+        result = fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=start)
+
+        assert [c.timestamp for c in result] == [start]
+        client.get_klines.return_value = []
+        with pytest.raises(RuntimeError, match="No data returned"):
+            fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=start)
+
+    def test_fetch_range_drops_repeated_boundary_candle(self):
+        hour_ms = 3_600_000
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 3, 15, tzinfo=timezone.utc)
+
+        def get_klines(symbol, interval, startTime, endTime, limit):
+            # Each page also repeats the candle just before its window
+            return [
+                [t, "100", "101", "99", "100.5", "1"]
+                for t in range(startTime - hour_ms, endTime + 1, hour_ms)
+            ]
+
+        client = MagicMock()
+        client.get_klines.side_effect = get_klines
+
+        batch = fetch_ohlcv_binance(
+            client, "BTCUSDT", "1h", start=start, end=end, return_batch=True
+        )
+
+        timestamps = batch.timestamp.astype(np.int64)
+        assert (np.diff(timestamps) == hour_ms).all()
+        assert timestamps[0] == int(start.timestamp() * 1000)
+        assert len(batch) == (end - start) // timedelta(hours=1) + 1
+
+    def test_fetch_range_serves_closed_windows_from_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CANDLECRAFT_CACHE_DIR", str(tmp_path))
+        hour_ms = 3_600_000
+        start = datetime(2024, 1, 1, 5, tzinfo=timezone.utc)
+        end = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+        def get_klines(symbol, interval, startTime, endTime, limit):
+            return [
+                [t, "100", "101", "99", "100.5", "1"]
+                for t in range(startTime, endTime + 1, hour_ms)
+            ]
+
+        client = MagicMock()
+        client.get_klines.side_effect = get_klines
+
+        first = fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=end)
+        calls = client.get_klines.call_count
+        assert calls > 0
+        assert first[0].timestamp == start
+        assert first[-1].timestamp == end
+
+        # A later, overlapping range is served entirely from cached windows
+        second = fetch_ohlcv_binance(
+            client, "BTCUSDT", "1h", start=start + timedelta(days=3), end=end
+        )
+        assert client.get_klines.call_count == calls
+        assert [c.timestamp for c in second] == [c.timestamp for c in first[72:]]
+
+    def test_fetch_range_does_not_cache_open_windows(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CANDLECRAFT_CACHE_DIR", str(tmp_path))
+        end = datetime.now(timezone.utc).replace(microsecond=0)
+        start = end - timedelta(days=2)
+
+        def get_klines(symbol, interval, startTime, endTime, limit):
+            return [
+                [t, "100", "101", "99", "100.5", "1"]
+                for t in range(startTime, endTime + 1, 3_600_000)
+            ]
+
+        client = MagicMock()
+        client.get_klines.side_effect = get_klines
+
+        fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=end, return_batch=True)
+        fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=end, return_batch=True)
+
+        assert client.get_klines.call_count == 2 * len(
+            {c.kwargs["startTime"] for c in client.get_klines.call_args_list}
+        )
+
+    def test_invalid_range_is_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CANDLECRAFT_CACHE_DIR", str(tmp_path))
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(hours=5)
+        client = MagicMock()
+        client.get_klines.return_value = [
+            [int(start.timestamp() * 1000), "100", "99", "98", "100.5", "1"],
+        ]
+
+        with pytest.raises(RuntimeError, match="Invalid OHLCV"):
+            fetch_ohlcv_binance(client, "BTCUSDT", "1h", start=start, end=end)
+
+        assert not any(tmp_path.rglob("*.npy"))
 
     def test_unsupported_timeframe(self):
         client = MagicMock()
@@ -149,6 +364,129 @@ class TestFetchOhlcvTwelveDataMocked:
         assert result[0].symbol == "AAPL"
         assert result[0].close == 100.5
 
+    def test_fetch_skips_malformed_rows(self):
+        client = MagicMock()
+        index = pd.to_datetime(["2024-01-01 09:30", "2024-01-02 09:30"]).tz_localize(
+            "America/New_York"
+        )
+        df = pd.DataFrame(
+            {
+                "open": [100.0, "n/a"],
+                "high": [101.0, 102.0],
+                "low": [99.0, 98.0],
+                "close": [100.5, 101.0],
+            },
+            index=index,
+        )
+        ts = MagicMock()
+        ts.as_pandas.return_value = df
+        client.time_series.return_value = ts
+
+        result = fetch_ohlcv_twelvedata(client, "AAPL", "1d", AssetClass.EQUITY, limit=2)
+
+        assert len(result) == 1
+        assert result[0].timestamp == datetime(2024, 1, 1, 14, 30, tzinfo=timezone.utc)
+        assert result[0].volume is None
+
+    def test_requests_are_paced_when_rate_is_configured(self, monkeypatch):
+        from candlecraft import providers
+
+        monkeypatch.setenv("CANDLECRAFT_TD_RATE", "1")
+        providers._twelvedata_bucket.cache_clear()
+        client = MagicMock()
+        ts = MagicMock()
+        ts.as_pandas.return_value = pd.DataFrame(
+            {"open": [1.1], "high": [1.2], "low": [1.0], "close": [1.1]},
+            index=pd.to_datetime(["2024-01-01"], utc=True),
+        )
+        client.time_series.return_value = ts
+
+        class Waited(Exception):
+            pass
+
+        fetch_ohlcv_twelvedata(client, "EUR/USD", "1d", AssetClass.FOREX, limit=1)
+        with patch.object(providers.time, "sleep", side_effect=Waited) as sleep:
+            with pytest.raises(Waited):
+                providers._pace_twelvedata(providers._twelvedata_rate())
+        providers._twelvedata_bucket.cache_clear()
+
+        assert sleep.call_args.args[0] > 50
+
+    @pytest.mark.parametrize("rate", ["0", "-5", "fast", "inf"])
+    def test_invalid_rate_setting_is_rejected(self, monkeypatch, rate):
+        monkeypatch.setenv("CANDLECRAFT_TD_RATE", rate)
+        client = MagicMock()
+
+        with pytest.raises(ValueError, match="CANDLECRAFT_TD_RATE"):
+            fetch_ohlcv_twelvedata(client, "EUR/USD", "1d", AssetClass.FOREX, limit=1)
+        client.time_series.assert_not_called()
+
+    def test_requests_wait_only_when_credit_headers_run_out(self, monkeypatch):
+        from candlecraft import providers
+
+        monkeypatch.setattr(
+            providers, "_twelvedata_credits", {"left": float("inf"), "reset_at": 0.0}
+        )
+        response = MagicMock(headers={"api-credits-left": "3"})
+        providers._record_twelvedata_credits(response)
+        with patch.object(providers.time, "sleep") as sleep:
+            providers._pace_twelvedata()
+        sleep.assert_not_called()
+
+        response.headers = {"api-credits-left": "0"}
+        providers._record_twelvedata_credits(response)
+        with patch.object(providers.time, "sleep") as sleep:
+            providers._pace_twelvedata()
+        assert 0 < sleep.call_args.args[0] <= 60
+
+    def test_fetch_range_is_cached_once_closed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CANDLECRAFT_CACHE_DIR", str(tmp_path))
+        client = MagicMock()
+        index = pd.to_datetime(["2024-01-01", "2024-01-02"], utc=True)
+        df = pd.DataFrame(
+            {
+                "open": [1.10, 1.11],
+                "high": [1.12, 1.13],
+                "low": [1.09, 1.10],
+                "close": [1.11, 1.12],
+            },
+            index=index,
+        )
+        ts = MagicMock()
+        ts.as_pandas.return_value = df
+        client.time_series.return_value = ts
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        first = fetch_ohlcv_twelvedata(
+            client, "EUR/USD", "1d", AssetClass.FOREX, start=start, end=end
+        )
+        second = fetch_ohlcv_twelvedata(
+            client, "EUR/USD", "1d", AssetClass.FOREX, start=start, end=end
+        )
+
+        client.time_series.assert_called_once()
+        assert second == first
+        assert second[0].volume is None
+
+    def test_invalid_range_is_not_cached(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CANDLECRAFT_CACHE_DIR", str(tmp_path))
+        client = MagicMock()
+        ts = MagicMock()
+        ts.as_pandas.return_value = pd.DataFrame(
+            {"open": [1.10], "high": [1.00], "low": [1.09], "close": [1.11]},
+            index=pd.to_datetime(["2024-01-01"], utc=True),
+        )
+        client.time_series.return_value = ts
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        with pytest.raises(RuntimeError, match="Invalid OHLCV"):
+            fetch_ohlcv_twelvedata(
+                client, "EUR/USD", "1d", AssetClass.FOREX, start=start, end=start
+            )
+
+        assert not any(tmp_path.rglob("*.npy"))
+
     def test_rate_limit_raise(self):
         client = MagicMock()
         client.time_series.side_effect = Exception("HTTP 429 Too Many Requests")
@@ -231,6 +569,25 @@ class TestFetchOhlcvProviderSelection:
                 )
 
 
+class TestFetchOhlcvMany:
+    def test_fetches_each_symbol_once_in_order(self):
+        def fake_fetch(symbol, timeframe, **kwargs):
+            return [_sample_candle(100.0 if symbol == "BTCUSDT" else 50.0)]
+
+        with patch("candlecraft.api.fetch_ohlcv", side_effect=fake_fetch) as fetch_mock:
+            result = fetch_ohlcv_many(["BTCUSDT", "ETHUSDT", "BTCUSDT"], "1h", limit=1)
+
+        assert list(result) == ["BTCUSDT", "ETHUSDT"]
+        assert result["ETHUSDT"][0].close == 50.0
+        assert fetch_mock.call_count == 2
+        fetch_mock.assert_any_call("ETHUSDT", "1h", limit=1)
+
+    def test_propagates_errors(self):
+        with patch("candlecraft.api.fetch_ohlcv", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError, match="boom"):
+                fetch_ohlcv_many(["BTCUSDT"], "1h", limit=1)
+
+
 class TestProviderAvailability:
     def test_binance_available_without_keys_when_installed(self):
         with patch("candlecraft.api.BINANCE_AVAILABLE", True):
@@ -242,3 +599,32 @@ class TestProviderAvailability:
                 assert is_provider_available(Provider.TWELVEDATA) is False
             with patch.dict("os.environ", {"TWELVEDATA_SECRET": "test-key"}):
                 assert is_provider_available(Provider.TWELVEDATA) is True
+
+
+class TestClientCaching:
+    def test_twelvedata_client_is_reused(self):
+        from candlecraft import providers
+
+        providers._twelvedata_client.cache_clear()
+        with patch.object(providers, "TDClient") as td_client_cls:
+            with patch.dict("os.environ", {"TWELVEDATA_SECRET": "test-key"}):
+                first = providers.authenticate_twelvedata()
+                second = providers.authenticate_twelvedata()
+        providers._twelvedata_client.cache_clear()
+
+        assert first is second
+        td_client_cls.assert_called_once_with(apikey="test-key")
+        first.ctx.http_client.session.mount.assert_called_once()
+
+    def test_sessions_retry_rate_limits_and_server_errors(self):
+        import requests
+
+        from candlecraft import providers
+
+        session = requests.Session()
+        providers._mount_pooled_adapter(session)
+        retry = session.get_adapter("https://api.binance.com").max_retries
+
+        assert {429, 500, 502, 503, 504} <= set(retry.status_forcelist)
+        assert retry.respect_retry_after_header
+        assert not retry.raise_on_status